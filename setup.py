@@ -115,7 +115,7 @@ setup(
         "saio",
         "seaborn",
         "setuptools>60.0",
-        "shapely",
+        "shapely>=2.0",
         "snakemake<7",
         "sqlalchemy",
         "tabulate==0.8.0",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from pathlib import Path
+import functools
 import os
 import sys
 
@@ -102,7 +104,16 @@ def datasets(config_file=None):
         package_path = egon.data.__path__[0]
         config_file = os.path.join(package_path, "datasets.yml")
 
-    return yaml.load(open(config_file), Loader=yaml.SafeLoader)
+    # Hand out a copy, so callers modifying it don't alter the cached parse.
+    return deepcopy(_load_datasets(os.path.abspath(config_file)))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_datasets(config_file):
+    """Parse the dataset configuration file once per path."""
+    with open(config_file) as f:
+        return yaml.load(f, Loader=yaml.SafeLoader)
+
 
 def set_numexpr_threads():
     """Sets maximum threads used by NumExpr
@@ -18,6 +18,10 @@ import pandas as pd
 from egon.data import config, db
 from egon.data.datasets import Dataset
 from egon.data.datasets.electricity_demand.temporal import calc_load_curve
+from egon.data.datasets.electricity_demand_timeseries.tools import (
+    psql_insert_copy,
+    to_pg_array,
+)
 from egon.data.datasets.industry.temporal import identify_bus
 
 # CONSTANTS
@@ -192,9 +196,9 @@ def cts_data_import(cts_cool_vent_ac_share):
 
     dsm = pd.DataFrame(index=ts.index)
 
-    dsm["bus"] = ts["bus_id"].copy()
-    dsm["scn_name"] = ts["scn_name"].copy()
-    dsm["p_set"] = ts["p_set"].copy()
+    dsm["bus"] = ts["bus_id"]
+    dsm["scn_name"] = ts["scn_name"]
+    dsm["p_set"] = ts["p_set"]
 
     # calculate share of timeseries for air conditioning, cooling and
     # ventilation out of CTS-data
@@ -205,7 +209,7 @@ def cts_data_import(cts_cool_vent_ac_share):
         share = [float(item) * cts_cool_vent_ac_share for item in liste]
         timeseries.loc[index] = share
 
-    dsm["p_set"] = timeseries.copy()
+    dsm["p_set"] = timeseries
 
     return dsm
 
@@ -241,7 +245,7 @@ def ind_osm_data_import(ind_vent_cool_share):
 
         timeseries.loc[index] = share
 
-    dsm["p_set"] = timeseries.copy()
+    dsm["p_set"] = timeseries
 
     return dsm
 
@@ -277,7 +281,7 @@ def ind_osm_data_import_individual(ind_vent_cool_share):
 
         timeseries.loc[index] = share
 
-    dsm["p_set"] = timeseries.copy()
+    dsm["p_set"] = timeseries
 
     return dsm
 
@@ -314,7 +318,7 @@ def ind_sites_vent_data_import(ind_vent_share, wz):
         share = [float(item) * ind_vent_share for item in liste]
         timeseries.loc[index] = share
 
-    dsm["p_set"] = timeseries.copy()
+    dsm["p_set"] = timeseries
 
     return dsm
 
@@ -351,7 +355,7 @@ def ind_sites_vent_data_import_individual(ind_vent_share, wz):
         share = [float(item) * ind_vent_share for item in liste]
         timeseries.loc[index] = share
 
-    dsm["p_set"] = timeseries.copy()
+    dsm["p_set"] = timeseries
 
     return dsm
 
@@ -508,8 +512,8 @@ def calculate_potentials(s_flex, s_util, s_inc, s_dec, delta_t, dsm):
         loads
     """
 
-    # copy relevant timeseries
-    timeseries = dsm["p_set"].copy()
+    # relevant timeseries
+    timeseries = dsm["p_set"]
 
     # calculate scheduled load L(t)
 
@@ -549,31 +553,15 @@ def calculate_potentials(s_flex, s_util, s_inc, s_dec, delta_t, dsm):
     e_min = scheduled_load.copy()
 
     for index, liste in scheduled_load.items():
-        emin = []
-        emax = []
-        for i in range(len(liste)):
-            if i + delta_t > len(liste):
-                emax.append(
-                    (sum(liste[i:]) + sum(liste[: delta_t - (len(liste) - i)]))
-                )
-            else:
-                emax.append(sum(liste[i : i + delta_t]))
-            if i - delta_t < 0:
-                emin.append(
-                    (
-                        -1
-                        * (
-                            (
-                                sum(liste[:i])
-                                + sum(liste[len(liste) - delta_t + i :])
-                            )
-                        )
-                    )
-                )
-            else:
-                emin.append(-1 * sum(liste[i - delta_t : i]))
-        e_max.loc[index] = emax
-        e_min.loc[index] = emin
+        # sums over the (cyclic) windows of delta_t hours starting at each
+        # hour, the window ending before hour t is the one starting at
+        # t - delta_t
+        load = np.asarray(liste, dtype=float)
+        emax = np.lib.stride_tricks.sliding_window_view(
+            np.concatenate([load, load[:delta_t]]), delta_t
+        )[: len(load)].sum(axis=1)
+        e_max.loc[index] = emax.tolist()
+        e_min.loc[index] = (-np.roll(emax, delta_t)).tolist()
 
     return p_max, p_min, e_max, e_min
 
@@ -621,8 +609,8 @@ def create_dsm_components(
 
     # add DSM-buses to "original" buses
     dsm_buses = gpd.GeoDataFrame(index=dsm.index)
-    dsm_buses["original_bus"] = dsm["bus"].copy()
-    dsm_buses["scn_name"] = dsm["scn_name"].copy()
+    dsm_buses["original_bus"] = dsm["bus"]
+    dsm_buses["scn_name"] = dsm["scn_name"]
 
     # get original buses and add copy of relevant information
     target1 = config.datasets()["DSM_CTS_industry"]["targets"]["bus"]
@@ -675,9 +663,9 @@ def create_dsm_components(
     # add links from "orignal" buses to DSM-buses
 
     dsm_links = pd.DataFrame(index=dsm_buses.index)
-    dsm_links["original_bus"] = dsm_buses["original_bus"].copy()
-    dsm_links["dsm_bus"] = dsm_buses["bus_id"].copy()
-    dsm_links["scn_name"] = dsm_buses["scn_name"].copy()
+    dsm_links["original_bus"] = dsm_buses["original_bus"]
+    dsm_links["dsm_bus"] = dsm_buses["bus_id"]
+    dsm_links["scn_name"] = dsm_buses["scn_name"]
 
     # set link_id
     target2 = config.datasets()["DSM_CTS_industry"]["targets"]["link"]
@@ -712,9 +700,9 @@ def create_dsm_components(
     # add DSM-stores
 
     dsm_stores = pd.DataFrame(index=dsm_buses.index)
-    dsm_stores["bus"] = dsm_buses["bus_id"].copy()
-    dsm_stores["scn_name"] = dsm_buses["scn_name"].copy()
-    dsm_stores["original_bus"] = dsm_buses["original_bus"].copy()
+    dsm_stores["bus"] = dsm_buses["bus_id"]
+    dsm_stores["scn_name"] = dsm_buses["scn_name"]
+    dsm_stores["original_bus"] = dsm_buses["original_bus"]
 
     # set store_id
     target3 = config.datasets()["DSM_CTS_industry"]["targets"]["store"]
@@ -777,9 +765,10 @@ def aggregate_components(df_dsm_buses, df_dsm_links, df_dsm_stores):
     df_dsm_links.sort_values("scn_name", inplace=True)
 
     # calculate P_nom and P per unit
-    for index, row in df_dsm_links.iterrows():
-        nom = max(max(row.p_max), abs(min(row.p_min)))
-        df_dsm_links.at[index, "p_nom"] = nom
+    df_dsm_links["p_nom"] = [
+        max(p_max.max(), abs(p_min.min()))
+        for p_max, p_min in zip(df_dsm_links["p_max"], df_dsm_links["p_min"])
+    ]
 
     df_dsm_links["p_max"] = df_dsm_links["p_max"] / df_dsm_links["p_nom"]
     df_dsm_links["p_min"] = df_dsm_links["p_min"] / df_dsm_links["p_nom"]
@@ -808,9 +797,10 @@ def aggregate_components(df_dsm_buses, df_dsm_links, df_dsm_stores):
     df_dsm_stores.sort_values("scn_name", inplace=True)
 
     # calculate E_nom and E per unit
-    for index, row in df_dsm_stores.iterrows():
-        nom = max(max(row.e_max), abs(min(row.e_min)))
-        df_dsm_stores.at[index, "e_nom"] = nom
+    df_dsm_stores["e_nom"] = [
+        max(e_max.max(), abs(e_min.min()))
+        for e_max, e_min in zip(df_dsm_stores["e_max"], df_dsm_stores["e_min"])
+    ]
 
     df_dsm_stores["e_max"] = df_dsm_stores["e_max"] / df_dsm_stores["e_nom"]
     df_dsm_stores["e_min"] = df_dsm_stores["e_min"] / df_dsm_stores["e_nom"]
@@ -909,12 +899,13 @@ def data_export(dsm_buses, dsm_links, dsm_stores, carrier):
     insert_links_timeseries["temp_id"] = 1
 
     # insert into database
-    insert_links_timeseries.to_sql(
+    to_pg_array(insert_links_timeseries, ["p_min_pu", "p_max_pu"]).to_sql(
         targets["link_timeseries"]["table"],
         con=db.engine(),
         schema=targets["link_timeseries"]["schema"],
         if_exists="append",
         index=False,
+        method=psql_insert_copy,
     )
 
     # dsm_stores
@@ -943,12 +934,13 @@ def data_export(dsm_buses, dsm_links, dsm_stores, carrier):
     insert_stores_timeseries["temp_id"] = 1
 
     # insert into database
-    insert_stores_timeseries.to_sql(
+    to_pg_array(insert_stores_timeseries, ["e_min_pu", "e_max_pu"]).to_sql(
         targets["store_timeseries"]["table"],
         con=db.engine(),
         schema=targets["store_timeseries"]["schema"],
         if_exists="append",
         index=False,
+        method=psql_insert_copy,
     )
 
 
@@ -1075,9 +1067,9 @@ def dsm_cts_ind(
         con, p_max, p_min, e_max, e_min, dsm
     )
 
-    df_dsm_buses = dsm_buses.copy()
-    df_dsm_links = dsm_links.copy()
-    df_dsm_stores = dsm_stores.copy()
+    df_dsm_buses = dsm_buses
+    df_dsm_links = dsm_links
+    df_dsm_stores = dsm_stores
 
     # industry per osm-area: cooling and ventilation
 
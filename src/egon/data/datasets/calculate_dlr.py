@@ -8,10 +8,10 @@ Available at:
 
 from pathlib import Path
 
-from shapely.geometry import Point
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 import xarray as xr
 
 from egon.data import config, db
@@ -68,53 +68,55 @@ def dlr():
             sql, con, crs="EPSG:4326", geom_col="topo"
         )
 
-        trans_lines_R = {}
-        for i in regions.Region:
-            shape_area = regions[regions["Region"] == i]
-            trans_lines_R[i] = gpd.clip(df, shape_area)
-        trans_lines = df[["s_nom"]]
-        trans_lines["in_regions"] = [[] for i in range(len(df))]
+        # Find all pairs of intersecting transmission lines and regions with
+        # one query of a spatial index over the regions
+        line_idx, region_idx = shapely.STRtree(regions.geometry.values).query(
+            df.topo.values, predicate="intersects"
+        )
+        order = np.lexsort((region_idx, line_idx))
+
+        # Assign to each transmission line the regions to which it belongs
+        in_regions = [[] for i in range(len(df))]
+        for line, region in zip(
+            line_idx[order], regions.Region.values[region_idx[order]]
+        ):
+            if region not in in_regions[line]:
+                in_regions[line].append(region)
+
+        trans_lines = df[["s_nom"]].copy()
+        trans_lines["in_regions"] = in_regions
 
         trans_lines[["line_id", "geometry", "scn_name"]] = df[
             ["line_id", "topo", "scn_name"]
         ]
         trans_lines = gpd.GeoDataFrame(trans_lines)
-        # Assign to each transmission line the region to which it belongs
-        for i in trans_lines_R:
-            for j in trans_lines_R[i].index:
-                trans_lines.loc[j][1] = trans_lines.loc[j][1].append(i)
         trans_lines["crossborder"] = ~trans_lines.within(regions.unary_union)
 
+        # Hourly DLR per region, column i holds the values of region i + 1
+        dlr_regions = dlr_hourly.to_numpy()
+
         DLR = []
 
         # Assign to each transmision line the final values of DLR based on location
         # and type of line (overhead or underground)
-        for i in trans_lines.index:
-            # The concept of DLR does not apply to crossborder lines
-            if trans_lines.loc[i, "crossborder"] == True:
-                DLR.append([1] * 8760)
-                continue
-            # Underground lines have DLR = 1
+        for s_nom, in_regions, crossborder in zip(
+            trans_lines.s_nom, trans_lines.in_regions, trans_lines.crossborder
+        ):
+            # The concept of DLR does not apply to crossborder lines and
+            # underground lines have DLR = 1
             if (
-                trans_lines.loc[i][0] % 280 == 0
-                or trans_lines.loc[i][0] % 550 == 0
-                or trans_lines.loc[i][0] % 925 == 0
+                crossborder
+                or s_nom % 280 == 0
+                or s_nom % 550 == 0
+                or s_nom % 925 == 0
             ):
                 DLR.append([1] * 8760)
-                continue
-            # Lines completely in one of the regions, have the DLR of the region
-            if len(trans_lines.loc[i][1]) == 1:
-                region = int(trans_lines.loc[i][1][0])
-                DLR.append(dlr_hourly_dic["R" + str(region) + "-DLR"])
-                continue
-            # For lines crossing 2 or more regions, the lowest DLR between the
-            # different regions per hour is assigned.
-            if len(trans_lines.loc[i][1]) > 1:
-                reg = []
-                for j in trans_lines.loc[i][1]:
-                    reg.append("Reg_" + str(j))
-                min_DLR_reg = dlr_hourly[reg].min(axis=1)
-                DLR.append(list(min_DLR_reg))
+            # Lines completely in one of the regions, have the DLR of the
+            # region. For lines crossing 2 or more regions, the lowest DLR
+            # between the different regions per hour is assigned.
+            else:
+                region_idx = np.array(in_regions, dtype=int) - 1
+                DLR.append(dlr_regions[:, region_idx].min(axis=1).tolist())
 
         trans_lines["s_max_pu"] = DLR
 
@@ -124,10 +126,6 @@ def dlr():
             inplace=True,
         )
 
-        # Modify column "s_max_pu" to fit the requirement of the table
-        trans_lines["s_max_pu"] = trans_lines.apply(
-            lambda x: list(x["s_max_pu"]), axis=1
-        )
         trans_lines["temp_id"] = 1
 
         # Delete existing data
@@ -178,49 +176,23 @@ def DLR_Regions(weather_year, regions_shape_path):
     temperature_raw = weather_data_raw.temperature.values
     roughness_raw = weather_data_raw.roughness.values
     index = weather_data_raw.indexes._indexes
-    # The info in 'weather_data_raw' has 3 dimensions. In 'weather_data' will be
-    # stored all the relevant data in a 2 dimensions array.
-    weather_data = np.zeros(shape=(wind_speed_raw.size, 5))
-    count = 0
-    for hour in range(index["time"].size):
-        for row in range(index["y"].size):
-            for column in range(index["x"].size):
-                rough = roughness_raw[hour, row, column]
-                ws_100m = wind_speed_raw[hour, row, column]
-                # Use Log Law to calculate wind speed at 50m height
-                ws_50m = ws_100m * (np.log(50 / rough) / np.log(100 / rough))
-                weather_data[count, 0] = hour
-                weather_data[count, 1] = index["y"][row]
-                weather_data[count, 2] = index["x"][column]
-                weather_data[count, 3] = ws_50m
-                weather_data[count, 4] = (
-                    temperature_raw[hour, row, column] - 273.15
-                )
-                count += 1
-
-    weather_data = pd.DataFrame(
-        weather_data, columns=["hour", "lat", "lon", "wind_s", "temp"]
-    )
-
-    region_selec = weather_data[0 : index["x"].size * index["y"].size].copy()
-    region_selec["geom"] = region_selec.apply(
-        lambda x: Point(x["lon"], x["lat"]), axis=1
-    )
-    region_selec = gpd.GeoDataFrame(region_selec)
-    region_selec = region_selec.set_geometry("geom")
-    region_selec["region"] = np.zeros(index["x"].size * index["y"].size)
-
-    # Mask weather information for each region defined by NEP 2020
+    # The info in 'weather_data_raw' has 3 dimensions ordered by hour,
+    # latitude and longitude. Each weather cell becomes one column of a
+    # (hour, cell) array.
+    lat, lon = np.meshgrid(index["y"], index["x"], indexing="ij")
+    n_hours = index["time"].size
+    # Use Log Law to calculate wind speed at 50m height
+    ws_50m = (
+        wind_speed_raw
+        * (np.log(50 / roughness_raw) / np.log(100 / roughness_raw))
+    ).reshape(n_hours, -1)
+    temperature = (temperature_raw - 273.15).reshape(n_hours, -1)
+
+    # Mask weather cells for each region defined by NEP 2020
+    cells = shapely.points(lon.ravel(), lat.ravel())
+    cell_region = np.zeros(len(cells))
     for reg in regions.index:
-        weather_region = gpd.clip(region_selec, regions.loc[reg][0])
-        region_selec["region"][
-            region_selec.isin(weather_region).any(axis=1)
-        ] = reg
-
-    weather_data["region"] = (
-        region_selec["region"].tolist() * index["time"].size
-    )
-    weather_data = weather_data[weather_data["region"] != 0]
+        cell_region[shapely.intersects(regions.loc[reg][0], cells)] = reg
 
     # Create data frame to save results(Min wind speed, max temperature and %DLR per region along 8760h in a year)
     time = pd.date_range(
@@ -228,7 +200,7 @@ def DLR_Regions(weather_year, regions_shape_path):
     )
     # time = time.transpose()
     dlr = pd.DataFrame(
-        0,
+        0.0,
         columns=[
             "R1-Wind_min",
             "R1-Temp_max",
@@ -262,69 +234,34 @@ def DLR_Regions(weather_year, regions_shape_path):
     )
 
     # Calculate and save min wind speed and max temperature in a dataframe.
-    # Since the dataframe generated by the function era5.weather_df_from_era5() is sorted by date,
-    # it is faster to calculate the hourly results using blocks of data defined by "step", instead of
-    # using a filter or a search function.
-    for reg, df in weather_data.groupby("region"):
-        for t in range(0, len(time)):
-            step = df.shape[0] / len(time)
-            low_limit = int(t * step)
-            up_limit = int(step * (t + 1))
-            dlr.iloc[t, 0 + int(reg - 1) * 3] = min(
-                df.iloc[low_limit:up_limit, 3]
-            )
-            dlr.iloc[t, 1 + int(reg - 1) * 3] = max(
-                df.iloc[low_limit:up_limit, 4]
-            )
-
-    # The next loop use the min wind speed and max temperature calculated previously to
-    # define the hourly DLR for each region based on the table given by NEP 2020 pag 31
-    for i in range(0, len(regions)):
-        for j in range(0, len(time)):
-            if dlr.iloc[j, 1 + i * 3] <= 5:
-                if dlr.iloc[j, 0 + i * 3] < 3:
-                    dlr.iloc[j, 2 + i * 3] = 1.30
-                elif dlr.iloc[j, 0 + i * 3] < 4:
-                    dlr.iloc[j, 2 + i * 3] = 1.35
-                elif dlr.iloc[j, 0 + i * 3] < 5:
-                    dlr.iloc[j, 2 + i * 3] = 1.45
-                else:
-                    dlr.iloc[j, 2 + i * 3] = 1.50
-            elif dlr.iloc[j, 1 + i * 3] <= 15:
-                if dlr.iloc[j, 0 + i * 3] < 3:
-                    dlr.iloc[j, 2 + i * 3] = 1.20
-                elif dlr.iloc[j, 0 + i * 3] < 4:
-                    dlr.iloc[j, 2 + i * 3] = 1.25
-                elif dlr.iloc[j, 0 + i * 3] < 5:
-                    dlr.iloc[j, 2 + i * 3] = 1.35
-                elif dlr.iloc[j, 0 + i * 3] < 6:
-                    dlr.iloc[j, 2 + i * 3] = 1.45
-                else:
-                    dlr.iloc[j, 2 + i * 3] = 1.50
-            elif dlr.iloc[j, 1 + i * 3] <= 25:
-                if dlr.iloc[j, 0 + i * 3] < 3:
-                    dlr.iloc[j, 2 + i * 3] = 1.10
-                elif dlr.iloc[j, 0 + i * 3] < 4:
-                    dlr.iloc[j, 2 + i * 3] = 1.15
-                elif dlr.iloc[j, 0 + i * 3] < 5:
-                    dlr.iloc[j, 2 + i * 3] = 1.20
-                elif dlr.iloc[j, 0 + i * 3] < 6:
-                    dlr.iloc[j, 2 + i * 3] = 1.30
-                else:
-                    dlr.iloc[j, 2 + i * 3] = 1.40
-            elif dlr.iloc[j, 1 + i * 3] <= 35:
-                if dlr.iloc[j, 0 + i * 3] < 3:
-                    dlr.iloc[j, 2 + i * 3] = 1.00
-                elif dlr.iloc[j, 0 + i * 3] < 4:
-                    dlr.iloc[j, 2 + i * 3] = 1.05
-                elif dlr.iloc[j, 0 + i * 3] < 5:
-                    dlr.iloc[j, 2 + i * 3] = 1.10
-                elif dlr.iloc[j, 0 + i * 3] < 6:
-                    dlr.iloc[j, 2 + i * 3] = 1.15
-                else:
-                    dlr.iloc[j, 2 + i * 3] = 1.25
-            else:
-                dlr.iloc[j, 2 + i * 3] = 1.00
+    for reg in np.unique(cell_region[cell_region != 0]):
+        in_region = cell_region == reg
+        dlr.iloc[:, 0 + int(reg - 1) * 3] = ws_50m[:, in_region].min(axis=1)
+        dlr.iloc[:, 1 + int(reg - 1) * 3] = temperature[:, in_region].max(
+            axis=1
+        )
+
+    # The min wind speed and max temperature calculated previously define
+    # the hourly DLR for each region based on the table given by NEP 2020
+    # pag 31. Rows are the temperature classes (<= 5, 15, 25, 35 and above),
+    # columns the wind speed classes (< 3, 4, 5, 6 and above).
+    dlr_table = np.array(
+        [
+            [1.30, 1.35, 1.45, 1.50, 1.50],
+            [1.20, 1.25, 1.35, 1.45, 1.50],
+            [1.10, 1.15, 1.20, 1.30, 1.40],
+            [1.00, 1.05, 1.10, 1.15, 1.25],
+            [1.00, 1.00, 1.00, 1.00, 1.00],
+        ]
+    )
+    n_cols = 3 * len(regions)
+    temp_class = np.searchsorted(
+        [5, 15, 25, 35], dlr.iloc[:, 1:n_cols:3].values, side="left"
+    )
+    wind_class = np.searchsorted(
+        [3, 4, 5, 6], dlr.iloc[:, 0:n_cols:3].values, side="right"
+    )
+    dlr.iloc[:, 2:n_cols:3] = dlr_table[temp_class, wind_class]
 
     DLR_hourly_df_dic = {}
     for i in dlr.columns[range(2, 29, 3)]:  # columns with DLR values
@@ -6,7 +6,6 @@ The central module containing all code dealing with combined heat and power
 from pathlib import Path
 
 from geoalchemy2 import Geometry
-from shapely.ops import nearest_points
 from sqlalchemy import Boolean, Column, Float, Integer, Sequence, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -87,54 +86,6 @@ def create_tables():
     )
 
 
-def nearest(
-    row,
-    df,
-    centroid=False,
-    row_geom_col="geometry",
-    df_geom_col="geometry",
-    src_column=None,
-):
-    """
-    Finds the nearest point and returns the specified column values
-
-    Parameters
-    ----------
-    row : pandas.Series
-        Data to which the nearest data of df is assigned.
-    df : pandas.DataFrame
-        Data which includes all options for the nearest neighbor alogrithm.
-    centroid : boolean
-        Use centroid geoemtry. The default is False.
-    row_geom_col : str, optional
-        Name of row's geometry column. The default is 'geometry'.
-    df_geom_col : str, optional
-        Name of df's geometry column. The default is 'geometry'.
-    src_column : str, optional
-        Name of returned df column. The default is None.
-
-    Returns
-    -------
-    value : pandas.Series
-        Values of specified column of df
-
-    """
-
-    if centroid:
-        unary_union = df.centroid.unary_union
-    else:
-        unary_union = df[df_geom_col].unary_union
-    # Find the geometry that is closest
-    nearest = (
-        df[df_geom_col] == nearest_points(row[row_geom_col], unary_union)[1]
-    )
-
-    # Get the corresponding value from df (matching is based on the geometry)
-    value = df[nearest][src_column].values[0]
-
-    return value
-
-
 def assign_heat_bus():
     """Selects heat_bus for chps used in district heating.
 
@@ -177,16 +128,15 @@ def assign_heat_bus():
         )
 
         # Assign district heating area_id to district_heating_chp
-        # According to nearest centroid of district heating area
-        chp["district_heating_area_id"] = chp.apply(
-            nearest,
-            df=district_heating,
-            row_geom_col="geom",
-            df_geom_col="geom",
-            centroid=True,
-            src_column="area_id",
-            axis=1,
+        # According to nearest centroid of district heating area, the first
+        # area is taken if several centroids are equally close
+        chp_idx, area_idx = district_heating.sindex.nearest(
+            chp.geom, return_all=True
         )
+        nearest_area = pd.Series(area_idx).groupby(chp_idx).min().to_numpy()
+        chp["district_heating_area_id"] = district_heating[
+            "area_id"
+        ].to_numpy()[nearest_area]
 
         # Drop district heating CHP without heat_bus_id
         db.execute_sql(
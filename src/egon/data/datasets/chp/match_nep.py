@@ -236,6 +236,11 @@ def match_nep_chp(
         }
     )
 
+    # Matched CHP and their index in chp_NEP, collected over all carriers
+    # and combined once after the matching
+    matched = [chp_NEP_matched]
+    matched_index = []
+
     for ET in chp_NEP["carrier"].unique():
 
         for index, row in chp_NEP[
@@ -243,9 +248,9 @@ def match_nep_chp(
         ].iterrows():
 
             # Select plants from MaStR that match carrier, PLZ
-            # and have a similar capacity
-            # Create a copy of all power plants from MaStR
-            selected = MaStR_konv.copy()
+            # and have a similar capacity. The filters below return new
+            # frames, so MaStR_konv itself is never changed.
+            selected = MaStR_konv
 
             # Set capacity constraint using buffer
             if consider_capacity:
@@ -271,11 +276,9 @@ def match_nep_chp(
                     selected.city == row.city.replace("\n", " ")
                 ]
             elif consider_location == "federal_state":
-                selected.loc[:, "federal_state"] = list_federal_states[
-                    selected.federal_state
-                ].values
                 selected = selected[
-                    selected.federal_state == row.federal_state
+                    list_federal_states[selected.federal_state].values
+                    == row.federal_state
                 ]
 
             # Set capacity constraint if selected
@@ -284,7 +287,7 @@ def match_nep_chp(
 
             # If a plant could be matched, add this to chp_NEP_matched
             if len(selected) > 0:
-                chp_NEP_matched = chp_NEP_matched.append(
+                matched.append(
                     geopandas.GeoDataFrame(
                         data={
                             "source": "MaStR scaled with NEP 2021 list",
@@ -302,13 +305,18 @@ def match_nep_chp(
                     )
                 )
 
-                # Drop matched CHP from chp_NEP
-                chp_NEP = chp_NEP.drop(index)
+                # Mark matched CHP to be dropped from chp_NEP
+                matched_index.append(index)
 
                 # Drop matched CHP from MaStR list if the location is accurate
                 if consider_capacity & consider_carrier:
                     MaStR_konv = MaStR_konv.drop(selected.index)
 
+    chp_NEP_matched = pd.concat(matched)
+
+    # Drop matched CHP from chp_NEP
+    chp_NEP = chp_NEP.drop(matched_index)
+
     return chp_NEP_matched, MaStR_konv, chp_NEP
 
 
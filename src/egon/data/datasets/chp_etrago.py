@@ -83,9 +83,7 @@ def insert_egon100re():
         "eGon100RE",
     )
     # Set index
-    chp_el["link_id"] = range(
-        db.next_etrago_id("link"), len(chp_el) + db.next_etrago_id("link")
-    )
+    chp_el["link_id"] = db.next_etrago_ids("link", len(chp_el))
 
     # Add marginal cost which is only VOM in case of gas chp
     chp_el["marginal_cost"] = get_sector_parameters("gas", "eGon100RE")[
@@ -115,9 +113,7 @@ def insert_egon100re():
         "eGon100RE",
     )
 
-    chp_heat["link_id"] = range(
-        db.next_etrago_id("link"), len(chp_heat) + db.next_etrago_id("link")
-    )
+    chp_heat["link_id"] = db.next_etrago_ids("link", len(chp_heat))
 
     chp_heat.to_postgis(
         targets["link"]["table"],
@@ -132,6 +128,13 @@ def insert_scenario(scenario):
 
     targets = config.datasets()["chp_etrago"]["targets"]
 
+    gas_marginal_cost = get_sector_parameters("gas", scenario)[
+        "marginal_cost"
+    ]["chp_gas"]
+    electricity_marginal_cost = pd.Series(
+        get_sector_parameters("electricity", scenario)["marginal_cost"]
+    ).rename({"other_non_renewable": "others"})
+
     db.execute_sql(
         f"""
         DELETE FROM {targets['link']['schema']}.{targets['link']['table']}
@@ -200,14 +203,10 @@ def insert_scenario(scenario):
         scenario,
     )
     # Set index
-    chp_el["link_id"] = range(
-        db.next_etrago_id("link"), len(chp_el) + db.next_etrago_id("link")
-    )
+    chp_el["link_id"] = db.next_etrago_ids("link", len(chp_el))
 
     # Add marginal cost which is only VOM in case of gas chp
-    chp_el["marginal_cost"] = get_sector_parameters("gas", scenario)[
-        "marginal_cost"
-    ]["chp_gas"]
+    chp_el["marginal_cost"] = gas_marginal_cost
 
     # Insert into database
     chp_el.to_postgis(
@@ -232,9 +231,7 @@ def insert_scenario(scenario):
         scenario,
     )
 
-    chp_heat["link_id"] = range(
-        db.next_etrago_id("link"), len(chp_heat) + db.next_etrago_id("link")
-    )
+    chp_heat["link_id"] = db.next_etrago_ids("link", len(chp_heat))
 
     chp_heat.to_postgis(
         targets["link"]["table"],
@@ -257,19 +254,14 @@ def insert_scenario(scenario):
         },
     )
 
-    chp_el_gen["generator_id"] = range(
-        db.next_etrago_id("generator"),
-        len(chp_el_gen) + db.next_etrago_id("generator"),
+    chp_el_gen["generator_id"] = db.next_etrago_ids(
+        "generator", len(chp_el_gen)
     )
 
     # Add marginal cost
-    chp_el_gen["marginal_cost"] = (
-        pd.Series(
-            get_sector_parameters("electricity", scenario)["marginal_cost"]
-        )
-        .rename({"other_non_renewable": "others"})
-        .loc[chp_el_gen["carrier"]]
-    ).values
+    chp_el_gen["marginal_cost"] = electricity_marginal_cost.loc[
+        chp_el_gen["carrier"]
+    ].values
 
     chp_el_gen["carrier"] = (
         "central_" + chp_dh.loc[chp_generator_dh, "carrier"] + "_CHP"
@@ -295,9 +287,8 @@ def insert_scenario(scenario):
         },
     )
 
-    chp_heat_gen["generator_id"] = range(
-        db.next_etrago_id("generator"),
-        len(chp_heat_gen) + db.next_etrago_id("generator"),
+    chp_heat_gen["generator_id"] = db.next_etrago_ids(
+        "generator", len(chp_heat_gen)
     )
 
     chp_heat_gen.to_sql(
@@ -340,14 +331,10 @@ def insert_scenario(scenario):
         scenario,
     )
 
-    chp_el_ind["link_id"] = range(
-        db.next_etrago_id("link"), len(chp_el_ind) + db.next_etrago_id("link")
-    )
+    chp_el_ind["link_id"] = db.next_etrago_ids("link", len(chp_el_ind))
 
     # Add marginal cost which is only VOM in case of gas chp
-    chp_el_ind["marginal_cost"] = get_sector_parameters("gas", scenario)[
-        "marginal_cost"
-    ]["chp_gas"]
+    chp_el_ind["marginal_cost"] = gas_marginal_cost
 
     chp_el_ind.to_postgis(
         targets["link"]["table"],
@@ -369,18 +356,13 @@ def insert_scenario(scenario):
         },
     )
 
-    chp_el_ind_gen["generator_id"] = range(
-        db.next_etrago_id("generator"),
-        len(chp_el_ind_gen) + db.next_etrago_id("generator"),
+    chp_el_ind_gen["generator_id"] = db.next_etrago_ids(
+        "generator", len(chp_el_ind_gen)
     )
     # Add marginal cost
-    chp_el_ind_gen["marginal_cost"] = (
-        pd.Series(
-            get_sector_parameters("electricity", scenario)["marginal_cost"]
-        )
-        .rename({"other_non_renewable": "others"})
-        .loc[chp_el_ind_gen["carrier"]]
-    ).values
+    chp_el_ind_gen["marginal_cost"] = electricity_marginal_cost.loc[
+        chp_el_ind_gen["carrier"]
+    ].values
 
     # Update carrier
     chp_el_ind_gen["carrier"] = "industrial_" + chp_el_ind_gen.carrier + "_CHP"
@@ -17,6 +17,9 @@ from egon.data.datasets import Dataset
 from egon.data.datasets.demandregio.install_disaggregator import (
     clone_and_install,
 )
+from egon.data.datasets.electricity_demand_timeseries.tools import (
+    psql_insert_copy,
+)
 from egon.data.datasets.scenario_parameters import (
     EgonScenario,
     get_sector_parameters,
@@ -576,19 +579,22 @@ def insert_hh_demand(scenario, year, engine):
     # Select demands for nuts3-regions in boundaries (needed for testmode)
     ec_hh = data_in_boundaries(ec_hh)
 
-    # insert into database
-    for hh_size in ec_hh.columns:
-        df = pd.DataFrame(ec_hh[hh_size])
-        df["year"] = year
-        df["scenario"] = scenario
-        df["hh_size"] = hh_size
-        df = df.rename({hh_size: "demand"}, axis="columns")
-        df.to_sql(
-            targets["table"],
-            engine,
-            schema=targets["schema"],
-            if_exists="append",
-        )
+    # insert into database, all household sizes at once using COPY
+    df = (
+        ec_hh.rename_axis("nuts3")
+        .reset_index()
+        .melt(id_vars="nuts3", var_name="hh_size", value_name="demand")
+        .set_index("nuts3")
+    )
+    df["year"] = year
+    df["scenario"] = scenario
+    df.to_sql(
+        targets["table"],
+        engine,
+        schema=targets["schema"],
+        if_exists="append",
+        method=psql_insert_copy,
+    )
 
     # insert housholds demand timeseries
     hh_load_timeseries = (
@@ -670,20 +676,21 @@ def insert_cts_ind(scenario, year, engine, target_values):
         # Select demands for nuts3-regions in boundaries (needed for testmode)
         ec_cts_ind = data_in_boundaries(ec_cts_ind)
 
-        # insert into database
-        for wz in ec_cts_ind.columns:
-            df = pd.DataFrame(ec_cts_ind[wz])
-            df["year"] = year
-            df["wz"] = wz
-            df["scenario"] = scenario
-            df = df.rename({wz: "demand"}, axis="columns")
-            df.index = df.index.rename("nuts3")
-            df.to_sql(
-                targets["cts_ind_demand"]["table"],
-                engine,
-                targets["cts_ind_demand"]["schema"],
-                if_exists="append",
-            )
+        # insert into database, all wz at once using COPY
+        df = (
+            ec_cts_ind.reset_index()
+            .melt(id_vars="nuts3", var_name="wz", value_name="demand")
+            .set_index("nuts3")
+        )
+        df["year"] = year
+        df["scenario"] = scenario
+        df.to_sql(
+            targets["cts_ind_demand"]["table"],
+            engine,
+            targets["cts_ind_demand"]["schema"],
+            if_exists="append",
+            method=psql_insert_copy,
+        )
 
 
 def insert_household_demand():
@@ -8,8 +8,10 @@ import requests
 import logging
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pypsa
+import shapely
 from shapely.geometry import LineString
 from sqlalchemy.orm import sessionmaker
 
@@ -483,17 +485,15 @@ def cross_border_lines(scenario, sources, targets, central_buses):
 
     if config.settings()["egon-data"]["--dataset-boundary"] == "Everything":
         new_lines = new_lines[~new_lines.country.isnull()]
-    new_lines.line_id = range(
-        db.next_etrago_id("line"), db.next_etrago_id("line") + len(new_lines)
-    )
+    new_lines.line_id = db.next_etrago_ids("line", len(new_lines))
 
     # Set bus in center of foreign countries as bus1
-    for i, row in new_lines.iterrows():
-        print(row)
-        new_lines.loc[i, "bus1"] = central_buses.bus_id[
-            (central_buses.country == row.country)
-            & (central_buses.v_nom == row.v_nom)
-        ].values[0]
+    central_bus_ids = central_buses.drop_duplicates(
+        ["country", "v_nom"]
+    ).set_index(["country", "v_nom"])["bus_id"]
+    new_lines["bus1"] = central_bus_ids.loc[
+        pd.MultiIndex.from_arrays([new_lines.country, new_lines.v_nom])
+    ].values
 
     # Create geometry for new lines
     new_lines["geom_bus0"] = (
@@ -635,45 +635,52 @@ def central_transformer(scenario, sources, targets, central_buses, new_lines):
         """
     )
 
-    # Initalize the dataframe for transformers
-    trafo = gpd.GeoDataFrame(
-        columns=["trafo_id", "bus0", "bus1", "s_nom"], dtype=int
-    )
-    trafo_id = db.next_etrago_id("transformer")
-
     # Add one transformer per central foreign bus with v_nom != 380
-    for i, row in central_buses[central_buses.v_nom != 380].iterrows():
-        s_nom_0 = new_lines[new_lines.bus0 == row.bus_id].s_nom.sum()
-        s_nom_1 = new_lines[new_lines.bus1 == row.bus_id].s_nom.sum()
-        if s_nom_0 == 0.0:
-            s_nom = s_nom_1
-        elif s_nom_1 == 0.0:
-            s_nom = s_nom_0
-        else:
-            s_nom = min([s_nom_0, s_nom_1])
-
-        s_nom, x = choose_transformer(s_nom)
+    trafo_buses = central_buses[central_buses.v_nom != 380]
+
+    # Sum of nominal power of the lines at both sides of each bus and the
+    # 380 kV central bus of each country, computed once for all buses
+    s_nom_0 = (
+        new_lines.groupby("bus0")
+        .s_nom.sum()
+        .reindex(trafo_buses.bus_id, fill_value=0.0)
+        .values
+    )
+    s_nom_1 = (
+        new_lines.groupby("bus1")
+        .s_nom.sum()
+        .reindex(trafo_buses.bus_id, fill_value=0.0)
+        .values
+    )
+    s_nom_min = np.where(
+        s_nom_0 == 0.0,
+        s_nom_1,
+        np.where(s_nom_1 == 0.0, s_nom_0, np.minimum(s_nom_0, s_nom_1)),
+    )
+    transformers = [choose_transformer(s_nom) for s_nom in s_nom_min]
+    s_nom_trafo = [s_nom for s_nom, x in transformers]
+    x_trafo = [x for s_nom, x in transformers]
+
+    bus_380 = (
+        central_buses[central_buses.v_nom == 380]
+        .drop_duplicates("country")
+        .set_index("country")
+        .bus_id
+    )
+    bus1 = bus_380.loc[trafo_buses.country].values
 
-        trafo = pd.concat(
-            [
-                trafo,
-                pd.DataFrame(
-                    index=[trafo.index.max() + 1],
-                    data={
-                        "trafo_id": trafo_id,
-                        "bus0": row.bus_id,
-                        "bus1": central_buses[
-                            (central_buses.v_nom == 380)
-                            & (central_buses.country == row.country)
-                        ].bus_id.values[0],
-                        "s_nom": s_nom,
-                        "x": x,
-                    },
-                ),
-            ],
-            ignore_index=True,
-        )
-        trafo_id += 1
+    # Select the next free transformer id and number the new transformers
+    # consecutively from there
+    trafo_id = db.next_etrago_id("transformer")
+    trafo = gpd.GeoDataFrame(
+        {
+            "trafo_id": range(trafo_id, trafo_id + len(trafo_buses)),
+            "bus0": trafo_buses.bus_id.values,
+            "bus1": bus1,
+            "s_nom": s_nom_trafo,
+            "x": x_trafo,
+        }
+    )
 
     # Set data type
     trafo = trafo.astype({"trafo_id": "int", "bus0": "int", "bus1": "int"})
@@ -937,14 +944,11 @@ def get_foreign_bus_id(scenario):
         geometry=gpd.points_from_xy(buses.longitude, buses.latitude),
     ).to_crs(3035)
 
-    buses["bus_id"] = 0
-
-    # Select bus_id from etrago with shortest distance to TYNDP node
-    for i, row in buses.iterrows():
-        distance = bus_id.set_index("bus_id").geom.distance(row.geometry)
-        buses.loc[i, "bus_id"] = distance[
-            distance == distance.min()
-        ].index.values[0]
+    # Select bus_id from etrago with shortest distance to TYNDP node,
+    # ties are resolved by the order of the etrago buses
+    node_idx, bus_idx = bus_id.sindex.nearest(buses.geometry, return_all=True)
+    nearest = pd.Series(bus_idx).groupby(node_idx).min().to_numpy()
+    buses["bus_id"] = bus_id["bus_id"].to_numpy()[nearest]
 
     return buses.set_index("node_id").bus_id
 
@@ -1109,19 +1113,18 @@ def insert_generators(capacities):
     gen = add_marginal_costs(gen)
 
     # insert generators data
-    session = sessionmaker(bind=db.engine())()
-    for i, row in gen.iterrows():
-        entry = etrago.EgonPfHvGenerator(
-            scn_name=row.scenario,
-            generator_id=int(db.next_etrago_id("generator")),
-            bus=row.bus,
-            carrier=row.carrier,
-            p_nom=row.cap_2035,
-            marginal_cost=row.marginal_cost,
-        )
-
-        session.add(entry)
-        session.commit()
+    gen["generator_id"] = db.next_etrago_ids("generator", len(gen))
+    with db.session_scope() as session:
+        for i, row in gen.iterrows():
+            entry = etrago.EgonPfHvGenerator(
+                scn_name=row.scenario,
+                generator_id=row.generator_id,
+                bus=row.bus,
+                carrier=row.carrier,
+                p_nom=row.cap_2035,
+                marginal_cost=row.marginal_cost,
+            )
+            session.add(entry)
 
     # assign generators time-series data
 
@@ -1204,22 +1207,21 @@ def insert_storage(capacities):
         )
 
     # insert data
-    session = sessionmaker(bind=db.engine())()
-    for i, row in store.iterrows():
-        entry = etrago.EgonPfHvStorage(
-            scn_name="eGon2035",
-            storage_id=int(db.next_etrago_id("storage")),
-            bus=row.bus,
-            max_hours=row.max_hours,
-            efficiency_store=row.store,
-            efficiency_dispatch=row.dispatch,
-            standing_loss=row.standing_loss,
-            carrier=row.carrier,
-            p_nom=row.cap_2035,
-        )
-
-        session.add(entry)
-        session.commit()
+    store["storage_id"] = db.next_etrago_ids("storage", len(store))
+    with db.session_scope() as session:
+        for i, row in store.iterrows():
+            entry = etrago.EgonPfHvStorage(
+                scn_name="eGon2035",
+                storage_id=row.storage_id,
+                bus=row.bus,
+                max_hours=row.max_hours,
+                efficiency_store=row.store,
+                efficiency_dispatch=row.dispatch,
+                standing_loss=row.standing_loss,
+                carrier=row.carrier,
+                p_nom=row.cap_2035,
+            )
+            session.add(entry)
 
 
 def get_map_buses():
@@ -1818,19 +1820,20 @@ def insert_generators_sq(scn_name="status2019"):
     list_gen_sq["bus"] = list_gen_sq.country.map(entsoe_to_bus)
 
     # insert generators data
-    session = sessionmaker(bind=db.engine())()
-    for i, row in list_gen_sq.iterrows():
-        entry = etrago.EgonPfHvGenerator(
-            scn_name=row.scenario,
-            generator_id=int(db.next_etrago_id("generator")),
-            bus=row.bus,
-            carrier=row.carrier,
-            p_nom=row.capacity,
-            marginal_cost=row.marginal_cost,
-        )
-
-        session.add(entry)
-        session.commit()
+    list_gen_sq["generator_id"] = db.next_etrago_ids(
+        "generator", len(list_gen_sq)
+    )
+    with db.session_scope() as session:
+        for i, row in list_gen_sq.iterrows():
+            entry = etrago.EgonPfHvGenerator(
+                scn_name=row.scenario,
+                generator_id=row.generator_id,
+                bus=row.bus,
+                carrier=row.carrier,
+                p_nom=row.capacity,
+                marginal_cost=row.marginal_cost,
+            )
+            session.add(entry)
 
     renewable_timeseries_pypsaeur(scn_name)
 
@@ -1887,38 +1890,61 @@ def renewable_timeseries_pypsaeur(scn_name):
         generators_pypsa_eur.index
     ].T.values.tolist()
 
-    session = sessionmaker(bind=db.engine())()
-
-    # Insert p_max_pu timeseries based on geometry and carrier
-    for gen in foreign_re_generators.index:
-        entry = etrago.EgonPfHvGeneratorTimeseries(
-            scn_name=scn_name,
-            generator_id=foreign_re_generators.loc[gen, "generator_id"],
-            temp_id=1,
-            p_max_pu=generators_pypsa_eur[
-                (
-                    (
-                        generators_pypsa_eur.x
-                        - foreign_re_generators.loc[gen, "x"]
-                    ).abs()
-                    < 0.01
-                )
-                & (
-                    (
-                        generators_pypsa_eur.y
-                        - foreign_re_generators.loc[gen, "y"]
-                    ).abs()
-                    < 0.01
-                )
-                & (
-                    generators_pypsa_eur.carrier
-                    == foreign_re_generators.loc[gen, "carrier"]
-                )
-            ].p_max_pu.iloc[0],
+    # Match each generator to the first pypsa-eur generator of the same
+    # carrier closer than 0.01 in x and y, candidates are taken from a
+    # spatial index over the pypsa-eur generators
+    tree = shapely.STRtree(
+        shapely.points(generators_pypsa_eur[["x", "y"]].to_numpy())
+    )
+    gen_idx, eur_idx = tree.query(
+        shapely.box(
+            foreign_re_generators.x - 0.01,
+            foreign_re_generators.y - 0.01,
+            foreign_re_generators.x + 0.01,
+            foreign_re_generators.y + 0.01,
+        )
+    )
+    match = (
+        (
+            np.abs(
+                generators_pypsa_eur.x.values[eur_idx]
+                - foreign_re_generators.x.values[gen_idx]
+            )
+            < 0.01
+        )
+        & (
+            np.abs(
+                generators_pypsa_eur.y.values[eur_idx]
+                - foreign_re_generators.y.values[gen_idx]
+            )
+            < 0.01
         )
+        & (
+            generators_pypsa_eur.carrier.values[eur_idx]
+            == foreign_re_generators.carrier.values[gen_idx]
+        )
+    )
+    first_match = (
+        pd.Series(eur_idx[match])
+        .groupby(gen_idx[match])
+        .min()
+        .loc[np.arange(len(foreign_re_generators))]
+        .values
+    )
+    p_max_pu = generators_pypsa_eur.p_max_pu.values[first_match]
 
-        session.add(entry)
-        session.commit()
+    # Insert p_max_pu timeseries based on geometry and carrier
+    with db.session_scope() as session:
+        for generator_id, ts in zip(
+            foreign_re_generators.generator_id, p_max_pu
+        ):
+            entry = etrago.EgonPfHvGeneratorTimeseries(
+                scn_name=scn_name,
+                generator_id=generator_id,
+                temp_id=1,
+                p_max_pu=ts,
+            )
+            session.add(entry)
 
 
 def insert_loads_sq(scn_name="status2019"):
@@ -111,7 +111,6 @@ is made in ... the content of this module docstring needs to be moved to
 docs attribute of the respective dataset class.
 """
 from functools import partial
-import random
 
 from geoalchemy2 import Geometry
 from sqlalchemy import REAL, Column, Integer, String, Table, func, inspect
@@ -124,7 +123,7 @@ from egon.data import db
 from egon.data.datasets import Dataset
 from egon.data.datasets.electricity_demand_timeseries.hh_profiles import (
     HouseholdElectricityProfilesInCensusCells,
-    get_iee_hh_demand_profiles_raw,
+    get_iee_hh_demand_profiles_memmap,
 )
 from egon.data.datasets.electricity_demand_timeseries.tools import (
     random_point_in_square,
@@ -229,8 +228,11 @@ def match_osm_and_zensus_data(
     )
 
     # identify cell ids with profiles but no buildings
+    # only building_ids holds NaNs from the left join, cell_id is int already
     number_of_buildings_profiles_per_cell = (
-        number_of_buildings_profiles_per_cell.fillna(0).astype(int)
+        number_of_buildings_profiles_per_cell.fillna(
+            {"building_ids": 0}
+        ).astype({"building_ids": np.int32, "cell_profile_ids": np.int32})
     )
     missing_buildings = number_of_buildings_profiles_per_cell.loc[
         number_of_buildings_profiles_per_cell.building_ids == 0,
@@ -445,16 +447,34 @@ def generate_mapping_table(
 
     """
 
-    def create_pool(buildings, profiles):
-        if profiles > buildings:
-            surplus = profiles - buildings
-            surplus = rng.integers(0, buildings, surplus)
-            pool = list(range(buildings)) + list(surplus)
-        else:
-            pool = list(range(buildings))
-        result = random.sample(population=pool, k=profiles)
+    def create_pools(buildings, profiles):
+        """Draw the building position of every profile for all cells at once.
+
+        The pool of a cell consists of all its building positions plus, if
+        there are more profiles than buildings, one randomly drawn position
+        per surplus profile. Each pool is shuffled and cut to the number of
+        profiles of the cell. All random numbers are taken in a single draw.
+        """
+        pool_size = np.maximum(buildings, profiles)
+        total = int(pool_size.sum())
+        # first row: surplus positions, second row: shuffle keys
+        u = rng.random((2, total))
+
+        segment = np.repeat(np.arange(len(pool_size)), pool_size)
+        starts = np.repeat(np.cumsum(pool_size) - pool_size, pool_size)
+        position = np.arange(total) - starts
+        buildings_seg = buildings[segment]
+
+        pool = np.where(
+            position < buildings_seg,
+            position,
+            (u[0] * buildings_seg).astype(np.int64),
+        )
+        # shuffle within cells, cells stay in order
+        order = np.lexsort((u[1], segment))
+        keep = position < profiles[segment]
 
-        return result
+        return pool[order][keep]
 
     # group oms_ids by census cells and aggregate to list
     osm_ids_per_cell = (
@@ -470,9 +490,13 @@ def generate_mapping_table(
         egon_hh_profile_in_zensus_cell["cell_id"].astype(int).values
     )
     # cell ids of cells with osm ids and profiles
-    cell_with_profiles_and_buildings = np.intersect1d(
-        cells_with_profiles, cells_with_buildings
-    )
+    # groupby index is sorted and unique, a binary search is sufficient
+    idx = np.searchsorted(cells_with_buildings, cells_with_profiles)
+    idx_clipped = np.clip(idx, 0, len(cells_with_buildings) - 1)
+    cell_with_profiles_and_buildings = cells_with_profiles[
+        (idx < len(cells_with_buildings))
+        & (cells_with_buildings[idx_clipped] == cells_with_profiles)
+    ]
 
     # cells with only buildings might not be residential etc.
 
@@ -485,39 +509,24 @@ def generate_mapping_table(
         cell_with_profiles_and_buildings, "id"
     ].rename("building_ids")
 
-    # concat both lists by same cell_id
-    mapping_profiles_to_buildings_reduced = pd.concat(
-        [profile_ids_per_cell_reduced, osm_ids_per_cell_reduced], axis=1
-    )
-
     # count number of profiles and buildings for each cell
     # tells how many profiles have to be assigned to how many buildings
-    number_profiles_and_buildings_reduced = (
-        mapping_profiles_to_buildings_reduced.applymap(len)
-    )
+    # both lists are indexed by the same cell_ids in the same order
+    n_profiles = profile_ids_per_cell_reduced.str.len().to_numpy()
+    n_buildings = osm_ids_per_cell_reduced.str.len().to_numpy()
 
     # map profiles randomly per cell
     # if profiles > buildings, every building will get at least one profile
     rng = np.random.default_rng(RANDOM_SEED)
-    random.seed(RANDOM_SEED)
-    mapping_profiles_to_buildings = pd.Series(
-        [
-            create_pool(buildings, profiles)
-            for buildings, profiles in zip(
-                number_profiles_and_buildings_reduced["building_ids"].values,
-                number_profiles_and_buildings_reduced[
-                    "cell_profile_ids"
-                ].values,
-            )
-        ],
-        index=number_profiles_and_buildings_reduced.index,
-    )
 
-    # unnest building assignement per cell
-    mapping_profiles_to_buildings = (
-        mapping_profiles_to_buildings.rename("building")
-        .explode()
-        .reset_index()
+    # building assignement per cell, already unnested
+    mapping_profiles_to_buildings = pd.DataFrame(
+        {
+            "cell_id": np.repeat(
+                profile_ids_per_cell_reduced.index.to_numpy(), n_profiles
+            ),
+            "building": create_pools(n_buildings, n_profiles),
+        }
     )
     # add profile position as attribute by number of entries per cell (*)
     mapping_profiles_to_buildings[
@@ -658,8 +667,8 @@ def get_building_peak_loads():
 
         df_buildings_and_profiles.replace({None: np.nan}, inplace=True)
 
-        # Read demand profiles from egon-data-bundle
-        df_profiles = get_iee_hh_demand_profiles_raw()
+        # Read demand profiles from egon-data-bundle (memory-mapped cache)
+        profiles, profile_ids = get_iee_hh_demand_profiles_memmap()
 
         def ve(s):
             raise (ValueError(s))
@@ -675,10 +684,18 @@ def get_building_peak_loads():
             else ve(f"'{dataset}' is not a valid dataset boundary.")
         )
 
-        df_building_peak_loads = pd.DataFrame()
+        df_building_peak_loads = []
 
         for nuts3, df in df_buildings_and_profiles.groupby(by=iterate_over):
-            df_building_peak_load_nuts3 = df_profiles.loc[:, df.profile_id]
+            profile_idx = profile_ids.get_indexer(df.profile_id)
+            if (profile_idx < 0).any():
+                raise KeyError(
+                    "Unknown profile ids: "
+                    f"{df.profile_id[profile_idx < 0].unique()}"
+                )
+            df_building_peak_load_nuts3 = pd.DataFrame(
+                profiles[:, profile_idx]
+            )
 
             m_index = pd.MultiIndex.from_arrays(
                 [df.profile_id, df.building_id],
@@ -691,23 +708,26 @@ def get_building_peak_loads():
                 .max()
             )
 
+            # scale peak load by the scenario factors of the group at once
+            factors = (
+                df[["factor_2019", "factor_2035", "factor_2050"]]
+                .iloc[0]
+                .to_numpy(dtype=float)
+            )
             df_building_peak_load_nuts3 = pd.DataFrame(
-                [
-                    df_building_peak_load_nuts3 * df["factor_2019"].unique(),
-                    df_building_peak_load_nuts3 * df["factor_2035"].unique(),
-                    df_building_peak_load_nuts3 * df["factor_2050"].unique(),
-                ],
-                index=[
+                df_building_peak_load_nuts3.to_numpy()[:, None]
+                * factors[None, :],
+                index=df_building_peak_load_nuts3.index,
+                columns=[
                     "status2019",
                     "eGon2035",
                     "eGon100RE",
                 ],
-            ).T
-
-            df_building_peak_loads = pd.concat(
-                [df_building_peak_loads, df_building_peak_load_nuts3], axis=0
             )
 
+            df_building_peak_loads.append(df_building_peak_load_nuts3)
+
+        df_building_peak_loads = pd.concat(df_building_peak_loads, axis=0)
         df_building_peak_loads.reset_index(inplace=True)
         df_building_peak_loads["sector"] = "residential"
 
@@ -762,16 +782,39 @@ def map_houseprofiles_to_buildings():
     inspect(engine).reflecttable(egon_map_zensus_buildings_residential, None)
 
     with db.session_scope() as session:
-        cells_query = session.query(egon_map_zensus_buildings_residential)
-    egon_map_zensus_buildings_residential = pd.read_sql(
-        cells_query.statement, cells_query.session.bind, index_col=None
-    )
+        cells_query = session.query(
+            egon_map_zensus_buildings_residential.c.id,
+            egon_map_zensus_buildings_residential.c.cell_id,
+        )
+    # stream with server-side cursor and fixed integer dtypes
+    with engine.connect().execution_options(stream_results=True) as con:
+        egon_map_zensus_buildings_residential = pd.concat(
+            pd.read_sql(
+                cells_query.statement,
+                con,
+                index_col=None,
+                dtype={"id": "int64", "cell_id": "int32"},
+                chunksize=500_000,
+            ),
+            ignore_index=True,
+        )
 
     with db.session_scope() as session:
-        cells_query = session.query(HouseholdElectricityProfilesInCensusCells)
-    egon_hh_profile_in_zensus_cell = pd.read_sql(
-        cells_query.statement, cells_query.session.bind, index_col=None
-    )  # index_col="cell_id")
+        cells_query = session.query(
+            HouseholdElectricityProfilesInCensusCells.cell_id,
+            HouseholdElectricityProfilesInCensusCells.cell_profile_ids,
+        )
+    with engine.connect().execution_options(stream_results=True) as con:
+        egon_hh_profile_in_zensus_cell = pd.concat(
+            pd.read_sql(
+                cells_query.statement,
+                con,
+                index_col=None,
+                dtype={"cell_id": "int32"},
+                chunksize=500_000,
+            ),
+            ignore_index=True,
+        )  # index_col="cell_id")
 
     # Match OSM and zensus data to define missing buildings
     missing_buildings = match_osm_and_zensus_data(
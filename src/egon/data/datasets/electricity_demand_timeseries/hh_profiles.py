@@ -318,6 +318,42 @@ def write_hh_profiles_to_db(hh_profiles):
     )
 
 
+def get_iee_hh_demand_profiles_file():
+    """Returns the path of the household electricity demand profiles file
+    in the egon-data-bundle for the current dataset boundary.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the hdf file with the raw IEE profiles
+    """
+    data_config = egon.data.config.datasets()
+    pa_config = data_config["hh_demand_profiles"]
+
+    def ve(s):
+        raise (ValueError(s))
+
+    dataset = egon.data.config.settings()["egon-data"]["--dataset-boundary"]
+
+    file_section = (
+        "path"
+        if dataset == "Everything"
+        else "path_testmode"
+        if dataset == "Schleswig-Holstein"
+        else ve(f"'{dataset}' is not a valid dataset boundary.")
+    )
+
+    file_path = pa_config["sources"]["household_electricity_demand_profiles"][
+        file_section
+    ]
+
+    download_directory = os.path.join(
+        "data_bundle_egon_data", "household_electricity_demand_profiles"
+    )
+
+    return Path(".") / Path(download_directory) / Path(file_path).name
+
+
 def get_iee_hh_demand_profiles_raw():
     """Gets and returns household electricity demand profiles from the
     egon-data-bundle.
@@ -354,33 +390,7 @@ def get_iee_hh_demand_profiles_raw():
         used to distinguish load profiles from different EUROSTAT household
         types.
     """
-    data_config = egon.data.config.datasets()
-    pa_config = data_config["hh_demand_profiles"]
-
-    def ve(s):
-        raise (ValueError(s))
-
-    dataset = egon.data.config.settings()["egon-data"]["--dataset-boundary"]
-
-    file_section = (
-        "path"
-        if dataset == "Everything"
-        else "path_testmode"
-        if dataset == "Schleswig-Holstein"
-        else ve(f"'{dataset}' is not a valid dataset boundary.")
-    )
-
-    file_path = pa_config["sources"]["household_electricity_demand_profiles"][
-        file_section
-    ]
-
-    download_directory = os.path.join(
-        "data_bundle_egon_data", "household_electricity_demand_profiles"
-    )
-
-    hh_profiles_file = (
-        Path(".") / Path(download_directory) / Path(file_path).name
-    )
+    hh_profiles_file = get_iee_hh_demand_profiles_file()
 
     df_hh_profiles = pd.read_hdf(hh_profiles_file)
 
@@ -395,6 +405,50 @@ def get_iee_hh_demand_profiles_raw():
     return df_hh_profiles
 
 
+def get_iee_hh_demand_profiles_memmap():
+    """Gets household electricity demand profiles as memory-mapped array.
+
+    On first call the profiles from :func:`get_iee_hh_demand_profiles_raw`
+    are stored as float32 `.npy` file next to the raw data in the
+    egon-data-bundle together with a sidecar file holding the profile ids.
+    Subsequent calls memory-map the cached array, which halves the memory
+    footprint and lets the OS page cache share it between runs. The cache
+    is rebuilt if the raw profiles are newer than the cache.
+
+    Returns
+    -------
+    profiles: np.memmap
+        Read-only float32 array with time in rows and profiles in columns
+    columns: pd.Index
+        Profile ids of the columns of `profiles`
+    """
+    hh_profiles_file = get_iee_hh_demand_profiles_file()
+    cache_file = hh_profiles_file.with_name(
+        f"{hh_profiles_file.stem}_float32.npy"
+    )
+    columns_file = hh_profiles_file.with_name(
+        f"{hh_profiles_file.stem}_columns.npy"
+    )
+
+    if (
+        not cache_file.exists()
+        or not columns_file.exists()
+        or cache_file.stat().st_mtime < hh_profiles_file.stat().st_mtime
+    ):
+        df_hh_profiles = get_iee_hh_demand_profiles_raw()
+        np.save(
+            cache_file,
+            np.ascontiguousarray(df_hh_profiles.to_numpy(dtype=np.float32)),
+        )
+        np.save(columns_file, df_hh_profiles.columns.to_numpy(dtype=str))
+        del df_hh_profiles
+
+    profiles = np.load(cache_file, mmap_mode="r")
+    columns = pd.Index(np.load(columns_file))
+
+    return profiles, columns
+
+
 def set_multiindex_to_profiles(hh_profiles):
     """The profile id is split into type and number and set as multiindex.
 
@@ -156,6 +156,33 @@ def psql_insert_copy(table, conn, keys, data_iter):
         cur.copy_expert(sql=sql, file=s_buf)
 
 
+def to_pg_array(df, columns):
+    """
+    Convert time series columns to postgres array literals
+
+    :func:`psql_insert_copy` writes the values as CSV, COPY expects the
+    text representation of arrays instead of python lists.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Data containing time series given as lists or arrays
+    columns : list of str
+        Columns to convert
+
+    Returns
+    -------
+    pandas.DataFrame
+        Copy of `df` with converted columns
+    """
+    return df.assign(
+        **{
+            col: ["{" + ",".join(map(str, ts)) + "}" for ts in df[col]]
+            for col in columns
+        }
+    )
+
+
 def write_table_to_postgres(
     df, db_table, drop=False, index=False, if_exists="append"
 ):
@@ -4,11 +4,11 @@ among NUTS 3 regions
 """
 from geovoronoi import points_to_coords, voronoi_regions_from_coords
 from loguru import logger
-from shapely import wkt
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon
 from shapely.ops import cascaded_union
 import geopandas as gpd
+import numpy as np
 
 from egon.data import config, db
 from egon.data.datasets.emobility.heavy_duty_transport.data_io import get_data
@@ -107,22 +107,20 @@ def geo_intersect(
         surface_area=intersection_gdf.geometry.area / 10**6
     )  # km²
 
-    # Initialize results column
-    nuts3_gdf = nuts3_gdf.assign(truck_traffic=0)
-
-    for voronoi_id in intersection_gdf.voronoi_id.unique():
-        voronoi_id_intersection_gdf = intersection_gdf.loc[
-            intersection_gdf.voronoi_id == voronoi_id
-        ]
-
-        total_area = voronoi_id_intersection_gdf.surface_area.sum()
-
-        truck_traffic = voronoi_id_intersection_gdf.truck_traffic.iat[0]
-
-        for idx, row in voronoi_id_intersection_gdf.iterrows():
-            traffic_share = truck_traffic * row["surface_area"] / total_area
+    # Distribute the truck traffic of each voronoi field to the intersecting
+    # NUTS3 areas according to their share of the field's area
+    voronoi_groups = intersection_gdf.groupby("voronoi_id")
+    traffic_share = (
+        voronoi_groups.truck_traffic.transform("first")
+        * intersection_gdf.surface_area
+        / voronoi_groups.surface_area.transform("sum")
+    )
 
-            nuts3_gdf.at[row["nuts3"], "truck_traffic"] += traffic_share
+    nuts3_gdf = nuts3_gdf.assign(
+        truck_traffic=traffic_share.groupby(intersection_gdf.nuts3)
+        .sum()
+        .reindex(nuts3_gdf.index, fill_value=0)
+    )
 
     logger.info("Done.")
 
@@ -151,23 +149,23 @@ def voronoi(
         coords, boundary_shape, return_unassigned_points=True
     )
 
-    multipoly_shapes = {}
-
-    for key, shape in poly_shapes.items():
-        if isinstance(shape, Polygon):
-            shape = wkt.loads(str(shape))
-            shape = MultiPolygon([shape])
-
-        multipoly_shapes[key] = [shape]
-
-    poly_gdf = gpd.GeoDataFrame.from_dict(
-        multipoly_shapes, orient="index", columns=["geometry"]
+    regions = list(poly_shapes)
+
+    # match points to old index in one go, first point of every region
+    poly_gdf = gpd.GeoDataFrame(
+        geometry=[
+            MultiPolygon([poly_shapes[region]])
+            if isinstance(poly_shapes[region], Polygon)
+            else poly_shapes[region]
+            for region in regions
+        ],
+        index=np.fromiter(
+            (pts[region][0] for region in regions),
+            dtype=np.int64,
+            count=len(regions),
+        ),
     )
 
-    # match points to old index
-    # FIXME: This seems overcomplicated
-    poly_gdf.index = [v[0] for v in pts.values()]
-
     poly_gdf = poly_gdf.sort_index()
 
     unmatched = [points.index[idx] for idx in unassigned_pts]
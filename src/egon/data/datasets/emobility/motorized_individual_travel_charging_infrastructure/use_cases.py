@@ -7,6 +7,7 @@ from loguru import logger
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import config
 
@@ -151,28 +152,29 @@ def distribute_by_poi(region_poi: gpd.GeoDataFrame, num_points: int | float):
 def match_existing_points(
     region_points: gpd.GeoDataFrame, region_poi: gpd.GeoDataFrame
 ):
-    region_poi = region_poi.assign(exists=False)
     poi_buffer = region_poi.buffer(region_poi["radius"].astype(int))
-    region_points = region_points.assign(potential=0)
-    for i in region_points.index:
-        lis_point = region_points.at[i, "geometry"]
-        cluster = poi_buffer.contains(lis_point)
-        clusters = region_poi.loc[cluster]
-        num_clusters = len(clusters.index)
-
-        if num_clusters == 0:
-            # decent average as fallback
-            region_points.at[i, "potential"] = 5
-        elif num_clusters == 1:
-            region_points.at[i, "potential"] = clusters["potential"].values[0]
-            region_poi.loc[cluster, "exists"] = True
-
-        elif num_clusters > 1:
-            # choose cluster with closest Point
-            dist = clusters.distance(lis_point)
-            idx = dist.idxmin()
-            region_poi.at[idx, "exists"] = True
-            region_points.at[i, "potential"] = clusters.at[idx, "potential"]
+    # all (point, cluster) pairs where the cluster buffer contains the point
+    point_idx, poi_idx = poi_buffer.sindex.query(
+        region_points.geometry, predicate="within"
+    )
+    # if several clusters contain a point choose the one with the closest
+    # point, ties are resolved by the order of the clusters
+    dist = shapely.distance(
+        region_poi.geometry.values[poi_idx],
+        region_points.geometry.values[point_idx],
+    )
+    order = np.lexsort((poi_idx, dist, point_idx))
+    point_idx, first = np.unique(point_idx[order], return_index=True)
+    poi_idx = poi_idx[order][first]
+
+    # decent average as fallback for points without cluster
+    potential = np.full(len(region_points), 5, dtype=float)
+    potential[point_idx] = region_poi["potential"].to_numpy()[poi_idx]
+    region_points = region_points.assign(potential=potential)
+
+    exists = np.zeros(len(region_poi), dtype=bool)
+    exists[poi_idx] = True
+    region_poi = region_poi.assign(exists=exists)
 
     # delete all clusters with exists = True
     region_poi = region_poi.loc[~region_poi["exists"]]
@@ -240,10 +242,13 @@ def apportion_home(home_df: pd.DataFrame, num_spots: int, config: dict):
     samples = home_df.sample(
         num_spots, weights="num_available", random_state=1, replace=True
     )
-    result = pd.Series([0] * len(home_df.index), index=home_df.index)
-    for i in samples.index:
-        result.at[i] += 1
-    return result
+    # count how often each row was drawn
+    return pd.Series(
+        np.bincount(
+            home_df.index.get_indexer(samples.index), minlength=len(home_df)
+        ),
+        index=home_df.index,
+    )
 
 
 def home_charge_spots(house_array: pd.Series | np.array, config: dict):
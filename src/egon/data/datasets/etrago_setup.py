@@ -1,6 +1,5 @@
 # coding: utf-8
 from geoalchemy2.types import Geometry
-from shapely.geometry import LineString
 from sqlalchemy import (
     ARRAY,
     BigInteger,
@@ -16,7 +15,9 @@ from sqlalchemy import (
 )
 from sqlalchemy.ext.declarative import declarative_base
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import db
 from egon.data.datasets import Dataset
@@ -682,14 +683,11 @@ def link_geom_from_buses(df, scn_name):
         epsg=4326,
     )
 
-    # Create geometry columns for bus0 and bus1
-    df["geom_0"] = geom_buses.geom[df.bus0.values].values
-    df["geom_1"] = geom_buses.geom[df.bus1.values].values
+    # Select the coordinates of bus0 and bus1 and build all lines at once
+    coords_0 = shapely.get_coordinates(geom_buses.geom[df.bus0.values].values)
+    coords_1 = shapely.get_coordinates(geom_buses.geom[df.bus1.values].values)
 
-    geometry = df.apply(
-        lambda x: LineString([x["geom_0"], x["geom_1"]]), axis=1
-    )
-    df = df.drop(["geom_0", "geom_1"], axis=1)
+    geometry = shapely.linestrings(np.stack([coords_0, coords_1], axis=1))
 
     gdf = gpd.GeoDataFrame(df, geometry=geometry, crs=4326).rename_geometry(
         "topo"
@@ -287,30 +287,28 @@ def delete_previuos_gen(cfg, con, etrago_gen_orig, power_plants):
 
 
 def set_timeseries(power_plants, renew_feedin):
+    # Feedin time series per weather cell and carrier, looked up once here
+    # instead of filtering renew_feedin for every power plant
+    feedin = (
+        renew_feedin.drop_duplicates(["w_id", "carrier"])
+        .set_index(["w_id", "carrier"])["feedin"]
+        .to_dict()
+    )
+
     def timeseries(pp):
         if pp.weather_cell_id != -1:
-            feedin_time = renew_feedin[
-                (renew_feedin["w_id"] == pp.weather_cell_id)
-                & (renew_feedin["carrier"] == pp.carrier)
-            ].feedin.iloc[0]
-            return feedin_time
+            return feedin[(pp.weather_cell_id, pp.carrier)]
         else:
             df = power_plants[
                 (power_plants["bus_id"] == pp.bus_id)
                 & (power_plants["carrier"] == pp.carrier)
             ]
             total_int_cap = df.el_capacity.sum()
-            df["feedin"] = 0
-            df["feedin"] = df.apply(
-                lambda x: renew_feedin[
-                    (renew_feedin["w_id"] == x.weather_cell_id)
-                    & (renew_feedin["carrier"] == x.carrier)
-                ].feedin.iloc[0],
-                axis=1,
-            )
-            df["feedin"] = df.apply(
-                lambda x: x.el_capacity / total_int_cap * x.feedin, axis=1
+            return sum(
+                el_capacity / total_int_cap * feedin[(w_id, carrier)]
+                for el_capacity, w_id, carrier in zip(
+                    df.el_capacity, df.weather_cell_id, df.carrier
+                )
             )
-            return df.feedin.sum()
 
     return timeseries
@@ -28,6 +28,7 @@ from shapely import geometry
 import geopandas
 import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import config, db
 from egon.data.config import settings
@@ -555,12 +556,15 @@ def insert_gas_pipeline_list(
     )
     gas_pipelines_list["link_id"] = gas_pipelines_list["link_id"].astype(int)
 
+    # Parse the pipeline parameters once, they are used in several steps
+    gas_pipelines_list["param"] = [
+        ast.literal_eval(param) for param in gas_pipelines_list["param"]
+    ]
+
     # Cut data to federal state if in testmode
-    NUTS1 = []
-    for index, row in gas_pipelines_list.iterrows():
-        param = ast.literal_eval(row["param"])
-        NUTS1.append(param["nuts_id_1"])
-    gas_pipelines_list["NUTS1"] = NUTS1
+    gas_pipelines_list["NUTS1"] = [
+        param["nuts_id_1"] for param in gas_pipelines_list["param"]
+    ]
 
     map_states = {
         "Baden-Württemberg": "DE1",
@@ -598,46 +602,51 @@ def insert_gas_pipeline_list(
     gas_pipelines_list["p_nom_extendable"] = False
     gas_pipelines_list["p_min_pu"] = -1.0
 
-    diameter = []
-    geom = []
-    topo = []
-    length_km = []
-
-    for index, row in gas_pipelines_list.iterrows():
-        param = ast.literal_eval(row["param"])
-        diameter.append(param["diameter_mm"])
-        length_km.append(param["length_km"])
-
-        long_e = json.loads(row["long"])
-        lat_e = json.loads(row["lat"])
-        crd_e = list(zip(long_e, lat_e))
-        topo.append(geometry.LineString(crd_e))
-
-        long_path = param["path_long"]
-        lat_path = param["path_lat"]
-        crd = list(zip(long_path, lat_path))
-        crd.insert(0, crd_e[0])
-        crd.append(crd_e[1])
-        lines = []
-        for i in range(len(crd) - 1):
-            lines.append(geometry.LineString([crd[i], crd[i + 1]]))
-        geom.append(geometry.MultiLineString(lines))
-
-    gas_pipelines_list["diameter"] = diameter
-    gas_pipelines_list["geom"] = geom
-    gas_pipelines_list["topo"] = topo
-    gas_pipelines_list["length_km"] = length_km
+    params = gas_pipelines_list["param"]
+    gas_pipelines_list["diameter"] = [
+        param["diameter_mm"] for param in params
+    ]
+    gas_pipelines_list["length_km"] = [param["length_km"] for param in params]
+
+    # Start and end point of each pipeline
+    long_e = np.array([json.loads(x) for x in gas_pipelines_list["long"]])
+    lat_e = np.array([json.loads(x) for x in gas_pipelines_list["lat"]])
+    crd_e = np.stack([long_e, lat_e], axis=-1)
+    gas_pipelines_list["topo"] = shapely.linestrings(crd_e)
+
+    # Path of each pipeline from the start via its path points to the end,
+    # split into straight segments of consecutive points
+    paths = [
+        np.column_stack(
+            [
+                [crd[0, 0], *param["path_long"], crd[1, 0]],
+                [crd[0, 1], *param["path_lat"], crd[1, 1]],
+            ]
+        )
+        for crd, param in zip(crd_e, params)
+    ]
+    segments = shapely.linestrings(
+        np.stack(
+            [
+                np.concatenate([path[:-1] for path in paths]),
+                np.concatenate([path[1:] for path in paths]),
+            ],
+            axis=1,
+        )
+    )
+    gas_pipelines_list["geom"] = shapely.multilinestrings(
+        segments,
+        indices=np.repeat(
+            np.arange(len(paths)), [len(path) - 1 for path in paths]
+        ),
+    )
     gas_pipelines_list = gas_pipelines_list.set_geometry("geom", crs=4326)
 
-    country_0 = []
-    country_1 = []
-    for index, row in gas_pipelines_list.iterrows():
-        c = ast.literal_eval(row["country_code"])
-        country_0.append(c[0])
-        country_1.append(c[1])
-
-    gas_pipelines_list["country_0"] = country_0
-    gas_pipelines_list["country_1"] = country_1
+    country_code = [
+        ast.literal_eval(c) for c in gas_pipelines_list["country_code"]
+    ]
+    gas_pipelines_list["country_0"] = [c[0] for c in country_code]
+    gas_pipelines_list["country_1"] = [c[1] for c in country_code]
 
     # Correct non valid neighbouring country nodes
     gas_pipelines_list.loc[
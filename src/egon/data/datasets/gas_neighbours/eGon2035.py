@@ -6,10 +6,11 @@ from urllib.request import urlretrieve
 import ast
 import zipfile
 
-from shapely.geometry import LineString, MultiLineString
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pypsa
+import shapely
 
 from egon.data import config, db
 from egon.data.datasets.electrical_neighbours import (
@@ -83,14 +84,11 @@ def get_foreign_gas_bus_id(carrier="CH4"):
         geometry=gpd.points_from_xy(buses.longitude, buses.latitude),
     ).to_crs(3035)
 
-    buses["bus_id"] = 0
-
-    # Select bus_id from etrago with shortest distance to TYNDP node
-    for i, row in buses.iterrows():
-        distance = bus_id.set_index("bus_id").geom.distance(row.geometry)
-        buses.loc[i, "bus_id"] = distance[
-            distance == distance.min()
-        ].index.values[0]
+    # Select bus_id from etrago with shortest distance to TYNDP node,
+    # ties are resolved by the order of the etrago buses
+    node_idx, bus_idx = bus_id.sindex.nearest(buses.geometry, return_all=True)
+    nearest = pd.Series(bus_idx).groupby(node_idx).min().to_numpy()
+    buses["bus_id"] = bus_id["bus_id"].to_numpy()[nearest]
 
     return buses.set_index("node_id").bus_id
 
@@ -127,15 +125,12 @@ def read_LNG_capacities():
 
     conversion_factor = 437.5  # MCM/day to MWh/h
     c2 = 24 / 1000  # MWh/h to GWh/d
-    p_nom = []
-
-    for index, row in IGGIELGN_LNGs.iterrows():
-        param = ast.literal_eval(row["param"])
-        p_nom.append(
-            param["max_cap_store2pipe_M_m3_per_d"] * conversion_factor * c2
-        )
+    factor = conversion_factor * c2  # MCM/day to GWh/d
 
-    IGGIELGN_LNGs["LNG max_cap_store2pipe_M_m3_per_d (in GWh/d)"] = p_nom
+    IGGIELGN_LNGs["LNG max_cap_store2pipe_M_m3_per_d (in GWh/d)"] = [
+        ast.literal_eval(param)["max_cap_store2pipe_M_m3_per_d"] * factor
+        for param in IGGIELGN_LNGs["param"]
+    ]
 
     IGGIELGN_LNGs.drop(
         [
@@ -767,20 +762,20 @@ def insert_ch4_demand(global_demand, normalized_ch4_demandTS):
         ["UK00"], "GB"
     )
 
-    p_set = []
-    for index, row in ch4_demand_TS.iterrows():
-        normalized_TS_df = normalized_ch4_demandTS.loc[
-            :,
-            normalized_ch4_demandTS.columns.str.contains(row["Node/Line"][:2]),
-        ]
-        p_set.append(
-            (
-                normalized_TS_df[normalized_TS_df.columns[0]]
-                * row["GlobD_2035"]
-            ).tolist()
-        )
+    # Select the normalized time series once per country instead of
+    # searching the columns for every load
+    countries = ch4_demand_TS["Node/Line"].str[:2]
+    normalized_TS = {
+        country: normalized_ch4_demandTS.loc[
+            :, normalized_ch4_demandTS.columns.str.contains(country)
+        ].iloc[:, 0]
+        for country in countries.unique()
+    }
 
-    ch4_demand_TS["p_set"] = p_set
+    ch4_demand_TS["p_set"] = [
+        (normalized_TS[country] * demand).tolist()
+        for country, demand in zip(countries, ch4_demand_TS["GlobD_2035"])
+    ]
     ch4_demand_TS["temp_id"] = 1
     ch4_demand_TS = ch4_demand_TS.drop(
         columns=["Node/Line", "GlobD_2035", "bus", "carrier"]
@@ -1331,42 +1326,26 @@ def calculate_ch4_grid_capacities():
         epsg=4326,
     ).set_index("bus_id")
 
-    coordinates_bus0 = []
-    coordinates_bus1 = []
-
-    for index, row in Neighbouring_pipe_capacities_list.iterrows():
-        coordinates_bus0.append(bus_geom["geom"].loc[int(row["bus0"])])
-        coordinates_bus1.append(bus_geom["geom"].loc[int(row["bus1"])])
-
-    Neighbouring_pipe_capacities_list["coordinates_bus0"] = coordinates_bus0
-    Neighbouring_pipe_capacities_list["coordinates_bus1"] = coordinates_bus1
-
-    Neighbouring_pipe_capacities_list[
-        "topo"
-    ] = Neighbouring_pipe_capacities_list.apply(
-        lambda row: LineString(
-            [row["coordinates_bus0"], row["coordinates_bus1"]]
-        ),
-        axis=1,
+    # Build all pipeline geometries at once from the bus coordinates
+    coordinates_bus0 = shapely.get_coordinates(
+        bus_geom["geom"]
+        .loc[Neighbouring_pipe_capacities_list["bus0"].astype(int)]
+        .values
     )
-    Neighbouring_pipe_capacities_list[
-        "geom"
-    ] = Neighbouring_pipe_capacities_list.apply(
-        lambda row: MultiLineString([row["topo"]]), axis=1
+    coordinates_bus1 = shapely.get_coordinates(
+        bus_geom["geom"]
+        .loc[Neighbouring_pipe_capacities_list["bus1"].astype(int)]
+        .values
     )
-    Neighbouring_pipe_capacities_list[
-        "length"
-    ] = Neighbouring_pipe_capacities_list.apply(
-        lambda row: row["topo"].length, axis=1
+    topo = shapely.linestrings(
+        np.stack([coordinates_bus0, coordinates_bus1], axis=1)
     )
 
-    # Remove useless columns
-    Neighbouring_pipe_capacities_list = Neighbouring_pipe_capacities_list.drop(
-        columns=[
-            "coordinates_bus0",
-            "coordinates_bus1",
-        ]
+    Neighbouring_pipe_capacities_list["topo"] = topo
+    Neighbouring_pipe_capacities_list["geom"] = shapely.multilinestrings(
+        topo, indices=np.arange(len(topo))
     )
+    Neighbouring_pipe_capacities_list["length"] = shapely.length(topo)
 
     # Add missing columns
     c = {"scn_name": "eGon2035", "carrier": "CH4", "p_min_pu": -1.0}
@@ -1521,20 +1500,18 @@ def insert_ocgt_abroad():
     df_ocgt["carrier"] = carrier
     df_ocgt["scn_name"] = scn_name
 
-    buses = tuple(
-        db.select_dataframe(
-            f"""SELECT bus_id FROM grid.egon_etrago_bus
-            WHERE scn_name = '{scn_name}' AND country != 'DE';
-        """
-        )["bus_id"]
-    )
-
     # Delete old entries
     db.execute_sql(
         f"""
         DELETE FROM grid.egon_etrago_link WHERE "carrier" = '{carrier}'
         AND scn_name = '{scn_name}'
-        AND bus0 IN {buses} AND bus1 IN {buses};
+        AND bus0 IN (
+            SELECT bus_id FROM grid.egon_etrago_bus
+            WHERE scn_name = '{scn_name}' AND country != 'DE'
+        ) AND bus1 IN (
+            SELECT bus_id FROM grid.egon_etrago_bus
+            WHERE scn_name = '{scn_name}' AND country != 'DE'
+        );
         """
     )
 
@@ -2,14 +2,23 @@
 
 """
 from geoalchemy2.types import Geometry
-from geovoronoi import voronoi_regions_from_coords
+from scipy.spatial import Voronoi
 import geopandas as gpd
+import numpy as np
+import shapely
 
 
 def get_voronoi_geodataframe(buses, boundary):
     """
     Create voronoi polygons for the passed buses within the boundaries.
 
+    The voronoi diagram is calculated with :class:`scipy.spatial.Voronoi`.
+    Four helper points far outside of the boundary make the regions of all
+    buses finite, so that every region can be built from its vertices and
+    all of them are clipped to the boundary in one vectorized call. If
+    several buses share the same coordinates, the region is assigned to the
+    first of them.
+
     Parameters
     ----------
     buses : geopandas.GeoDataFrame
@@ -25,24 +34,57 @@ def get_voronoi_geodataframe(buses, boundary):
         polygons.
 
     """
-    buses = buses[buses.geometry.intersects(boundary)]
-
+    # cheap bounding box test first, exact test only for the survivors
+    minx, miny, maxx, maxy = boundary.bounds
     coords = buses[["x", "y"]].values  # coordinates of the respective buses
+    in_bounds = (
+        (coords[:, 0] >= minx)
+        & (coords[:, 0] <= maxx)
+        & (coords[:, 1] >= miny)
+        & (coords[:, 1] <= maxy)
+    )
+    buses = buses[in_bounds]
+    shapely.prepare(boundary)
+    in_boundary = shapely.intersects(boundary, buses.geometry.values)
+    buses = buses[in_boundary]
+
+    coords = coords[in_bounds][in_boundary]
+    coords, first_bus = np.unique(coords, axis=0, return_index=True)
 
-    region_polys, region_pts = voronoi_regions_from_coords(
-        coords, boundary, per_geom=False
+    # helper points far outside of the boundary to close all regions
+    margin = 10 * max(maxx - minx, maxy - miny)
+    helper_points = np.array(
+        [
+            [minx - margin, miny - margin],
+            [minx - margin, maxy + margin],
+            [maxx + margin, miny - margin],
+            [maxx + margin, maxy + margin],
+        ]
     )
+    vor = Voronoi(np.vstack([coords, helper_points]))
 
-    gpd_input_dict = {
-        "bus_id": [],  # original bus_id in the buses dataframe
-        "geometry": [],  # voronoi object
-    }
+    # voronoi regions are convex, the hull of the vertices is the polygon
+    regions = [vor.regions[i] for i in vor.point_region[: len(coords)]]
+    region_vertices = np.concatenate(regions)
+    region_index = np.repeat(
+        np.arange(len(regions)), [len(region) for region in regions]
+    )
+    region_polys = shapely.convex_hull(
+        shapely.multipoints(
+            vor.vertices[region_vertices], indices=region_index
+        )
+    )
 
-    for pt, poly in region_pts.items():
-        gpd_input_dict["geometry"] += [region_polys[pt]]
-        gpd_input_dict["bus_id"] += [buses.iloc[poly[0]]["bus_id"]]
+    region_polys = shapely.intersection(region_polys, boundary)
 
-    gdf = gpd.GeoDataFrame(gpd_input_dict)
+    gdf = gpd.GeoDataFrame(
+        {
+            # original bus_id in the buses dataframe
+            "bus_id": buses["bus_id"].to_numpy()[first_bus],
+            # voronoi object
+            "geometry": region_polys,
+        }
+    )
 
     # the id column is a relict of older voronoi generation methods
     gdf["id"] = gdf.index.values
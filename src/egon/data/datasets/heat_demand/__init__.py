@@ -807,7 +807,7 @@ def add_metadata():
             },
         },
     }
-    meta_json = "'" + json.dumps(meta) + "'"
+    meta_json = json.dumps(meta)
 
     db.submit_comment(meta_json, "demand", "egon_peta_heat")
 
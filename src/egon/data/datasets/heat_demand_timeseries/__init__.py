@@ -224,6 +224,36 @@ def create_district_heating_profile(scenario, area_id):
     return df
 
 
+def hourly_heat_demand(df, idp, per_building):
+    """Scale the selected intra-day profiles to hourly heat demands
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Selected intra-day profile and daily demand share per building and
+        day
+    idp : pandas.DataFrame
+        Intra-day profiles with one column per hour, indexed by profile id
+    per_building : pandas.Series
+        Annual heat demand per building indexed by zensus_population_id
+
+    Returns
+    -------
+    pandas.DataFrame
+        df with the hourly heat demands in the columns 0 to 23
+
+    """
+    df = df.reset_index(drop=True)
+    # Gather all selected profiles at once and scale them to the daily
+    # demand of the building
+    hourly = idp.loc[df.selected_idp].values * (
+        df.daily_demand_share.values
+        * per_building.loc[df.zensus_population_id].values
+    )[:, np.newaxis]
+
+    return pd.concat([df, pd.DataFrame(hourly)], axis="columns")
+
+
 def create_district_heating_profile_python_like(scenario="eGon2035"):
     """Creates profiles for all district heating grids in one scenario.
     Similar to create_district_heating_profile but faster and needs more RAM.
@@ -248,6 +278,9 @@ def create_district_heating_profile_python_like(scenario="eGon2035"):
         """,
         index_col="index",
     )
+    idp_df = pd.DataFrame(
+        np.stack(idp_df.idp.values).astype(np.float32), index=idp_df.index
+    )
 
     district_heating_grids = db.select_dataframe(
         f"""
@@ -334,25 +367,10 @@ def create_district_heating_profile_python_like(scenario="eGon2035"):
                 on=["day", "climate_zone"],
             )
 
-            slice_df = pd.merge(
-                df[df.area_id == area],
-                idp_df,
-                left_on="selected_idp",
-                right_on="index",
+            slice_df = hourly_heat_demand(
+                df[df.area_id == area], idp_df, annual_demand.per_building
             )
 
-            for hour in range(24):
-                slice_df[hour] = (
-                    slice_df.idp.str[hour]
-                    .mul(slice_df.daily_demand_share)
-                    .mul(
-                        annual_demand.loc[
-                            slice_df.zensus_population_id.values,
-                            "per_building",
-                        ].values
-                    )
-                )
-
             diff = (
                 slice_df[range(24)].sum().sum()
                 - annual_demand[
@@ -382,7 +400,6 @@ def create_district_heating_profile_python_like(scenario="eGon2035"):
                         "selected_idp",
                         "area_id",
                         "daily_demand_share",
-                        "idp",
                     ],
                     axis="columns",
                 )
@@ -540,6 +557,9 @@ def create_individual_heating_peak_loads(scenario="eGon2035"):
         """,
         index_col="index",
     )
+    idp_df = pd.DataFrame(
+        np.stack(idp_df.idp.values).astype(np.float32), index=idp_df.index
+    )
 
     annual_demand = db.select_dataframe(
         f"""
@@ -610,20 +630,7 @@ def create_individual_heating_peak_loads(scenario="eGon2035"):
             selected_profiles, daily_demand_shares, on=["day", "climate_zone"]
         )
 
-        slice_df = pd.merge(
-            df, idp_df, left_on="selected_idp", right_on="index"
-        )
-
-        for hour in range(24):
-            slice_df[hour] = (
-                slice_df.idp.str[hour]
-                .mul(slice_df.daily_demand_share)
-                .mul(
-                    annual_demand.loc[
-                        slice_df.zensus_population_id.values, "per_building"
-                    ].values
-                )
-            )
+        slice_df = hourly_heat_demand(df, idp_df, annual_demand.per_building)
 
         calulate_peak_load(slice_df, scenario)
 
@@ -640,6 +647,9 @@ def create_individual_heating_profile_python_like(scenario="eGon2035"):
         """,
         index_col="index",
     )
+    idp_df = pd.DataFrame(
+        np.stack(idp_df.idp.values).astype(np.float32), index=idp_df.index
+    )
 
     annual_demand = db.select_dataframe(
         f"""
@@ -724,20 +734,7 @@ def create_individual_heating_profile_python_like(scenario="eGon2035"):
             selected_profiles, daily_demand_shares, on=["day", "climate_zone"]
         )
 
-        slice_df = pd.merge(
-            df, idp_df, left_on="selected_idp", right_on="index"
-        )
-
-        for hour in range(24):
-            slice_df[hour] = (
-                slice_df.idp.str[hour]
-                .mul(slice_df.daily_demand_share)
-                .mul(
-                    annual_demand.loc[
-                        slice_df.zensus_population_id.values, "per_building"
-                    ].values
-                )
-            )
+        slice_df = hourly_heat_demand(df, idp_df, annual_demand.per_building)
 
         cts = CTS_demand_grid[
             (CTS_demand_grid.scenario == scenario)
@@ -758,13 +755,13 @@ def create_individual_heating_profile_python_like(scenario="eGon2035"):
         ), f"""Deviation of residential heat demand time 
         series for mv grid {str(grid)} is {diff}"""
 
-        if not (slice_df[hour].empty or cts.empty):
+        if not (slice_df.empty or cts.empty):
             entry = EgonEtragoTimeseriesIndividualHeating(
                 bus_id=int(grid),
                 scenario=scenario,
                 dist_aggregated_mw=(hh + cts.values[0]).tolist(),
             )
-        elif not slice_df[hour].empty:
+        elif not slice_df.empty:
             entry = EgonEtragoTimeseriesIndividualHeating(
                 bus_id=int(grid),
                 scenario=scenario,
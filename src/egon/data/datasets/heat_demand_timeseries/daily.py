@@ -1,4 +1,5 @@
 from datetime import datetime
+import functools
 import os
 
 from sqlalchemy import Column, Float, Integer, Text
@@ -6,15 +7,13 @@ from sqlalchemy.ext.declarative import declarative_base
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import xarray as xr
 
 from egon.data import db, config
 from egon.data.datasets.scenario_parameters import get_sector_parameters
 import egon.data.datasets.era5 as era
 
 
-from math import ceil
-
-
 Base = declarative_base()
 
 
@@ -102,6 +101,62 @@ def temperature_classes():
     }
 
 
+def temperature_interval(temperature):
+    """Temperature interval of each value of a temperature vector
+
+    The temperatures are rounded up to full degrees and mapped to their
+    interval from :func:`temperature_classes` with one array lookup.
+    Temperatures outside of the table get the lowest or highest interval.
+
+    Parameters
+    ----------
+    temperature : array-like
+        Temperatures in °C
+
+    Returns
+    -------
+    numpy.ndarray
+        Temperature interval of each temperature
+
+    """
+    intervals = temperature_classes()
+    lowest = min(intervals)
+    lookup = np.array([intervals[t] for t in sorted(intervals)], dtype=np.int8)
+
+    rounded = np.ceil(np.asarray(temperature, dtype=float)).astype(int)
+
+    return lookup[np.clip(rounded - lowest, 0, len(lookup) - 1)]
+
+
+def geometric_series_mean(temperature):
+    """Weighted mean of the temperature of each hour and the three days before
+
+    The temperatures of the previous days are weighted with 0.5, 0.25 and
+    0.125, the time series is treated as cyclic. All shifted series are
+    slices of a single padded array.
+
+    Parameters
+    ----------
+    temperature : array-like
+        Hourly temperatures, time along the first axis
+
+    Returns
+    -------
+    numpy.ndarray
+        Geometric series mean with the shape of `temperature`
+
+    """
+    temperature = np.asarray(temperature)
+    padded = np.concatenate([temperature[-72:], temperature])
+
+    return (
+        padded[72:]
+        + 0.5 * padded[48:-24]
+        + 0.25 * padded[24:-48]
+        + 0.125 * padded[:-72]
+    ) / 1.875
+
+
 def map_climate_zones_to_zensus():
     """Geospatial join of zensus cells and climate zones
 
@@ -220,61 +275,14 @@ def daily_demand_shares_per_climate_zone():
     )
 
 
-class IdpProfiles:
-    def __init__(self, df_index, **kwargs):
-        self.df = pd.DataFrame(index=df_index)
-
-        self.temperature = kwargs.get("temperature")
-
-    def get_temperature_interval(self, how="geometric_series"):
-        """Appoints the corresponding temperature interval to each temperature
-        in the temperature vector.
-        """
-        self.df["temperature"] = self.temperature.values
-
-        temperature = (
-            self.df["temperature"]
-            .resample("D")
-            .mean()
-            .reindex(self.df.index)
-            .fillna(method="ffill")
-            .fillna(method="bfill")
-        )
-
-        if how == "geometric_series":
-            temperature_mean = (
-                temperature
-                + 0.5 * np.roll(temperature, 24)
-                + 0.25 * np.roll(temperature, 48)
-                + 0.125 * np.roll(temperature, 72)
-            ) / 1.875
-        elif how == "mean":
-            temperature_mean = temperature
-
-        else:
-            temperature_mean = None
-
-        self.df["temperature_geo"] = temperature_mean
-
-        temperature_rounded = []
-
-        for i in self.df["temperature_geo"]:
-            temperature_rounded.append(ceil(i))
-
-        intervals = temperature_classes()
-
-        temperature_interval = []
-        for i in temperature_rounded:
-            temperature_interval.append(intervals[i])
-
-        self.df["temperature_interval"] = temperature_interval
-
-        return self.df
-
-
+@functools.lru_cache(maxsize=None)
 def temperature_profile_extract():
     """
     Description: Extract temperature data from atlite
+
+    The profiles are read once and reused by :func:`temp_interval` and
+    :func:`h_value`, the returned dataframe must not be modified.
+
     Returns
     -------
     temperature_profile : pandas.DataFrame
@@ -294,26 +302,17 @@ def temperature_profile_extract():
         os.path.join(coordinates_path, "station_coordinates.csv")
     )
 
-    weather_cells = db.select_geodataframe(
-        """
-        SELECT geom FROM supply.egon_era5_weather_cells
-        """,
-        epsg=4326,
-    )
-
-    gdf = gpd.GeoDataFrame(
-        station_location,
-        geometry=gpd.points_from_xy(
-            station_location.Longitude, station_location.Latitude
-        ),
-    )
-
-    selected_weather_cells = gpd.sjoin(weather_cells, gdf).set_index("Station")
+    # Select the hourly temperature of the weather cell closest to each
+    # station, only these cells are read from the cutout
+    stations = pd.Index(station_location.Station, name="Station")
+    temperature = cutout.data.temperature.sel(
+        x=xr.DataArray(station_location.Longitude.values, dims="Station"),
+        y=xr.DataArray(station_location.Latitude.values, dims="Station"),
+        method="nearest",
+    ).assign_coords(Station=stations)
 
-    temperature_profile = cutout.temperature(
-        shapes=selected_weather_cells.geom.values,
-        index=selected_weather_cells.index,
-    ).to_pandas()
+    # Convert from Kelvin to degree Celsius
+    temperature_profile = (temperature - 273.15).to_pandas()
 
     return temperature_profile
 
@@ -332,19 +331,21 @@ def temp_interval():
     year = get_sector_parameters("global", scenario)["weather_year"]
 
     index = pd.date_range(datetime(year, 1, 1, 0), periods=8760, freq="H")
-    temperature_interval = pd.DataFrame()
     temp_profile = temperature_profile_extract()
 
-    for x in range(len(temp_profile.columns)):
-        name_station = temp_profile.columns[x]
-        idp_this_station = IdpProfiles(
-            index, temperature=temp_profile[temp_profile.columns[x]]
-        ).get_temperature_interval(how="geometric_series")
-        temperature_interval[name_station] = idp_this_station[
-            "temperature_interval"
-        ]
+    # Daily mean temperature of every hour for all stations at once
+    stations = temp_profile.columns
+    temperature_daily = np.repeat(
+        temp_profile.values.reshape(-1, 24, len(stations)).mean(axis=1),
+        24,
+        axis=0,
+    )
 
-    return temperature_interval
+    return pd.DataFrame(
+        temperature_interval(geometric_series_mean(temperature_daily)),
+        index=index,
+        columns=stations,
+    )
 
 
 def h_value():
@@ -381,15 +382,11 @@ def h_value():
         .fillna(method="bfill")
     )
 
-    temp_profile_geom = (
-        (
-            temperature_profile_res.transpose()
-            + 0.5 * np.roll(temperature_profile_res.transpose(), 24, axis=1)
-            + 0.25 * np.roll(temperature_profile_res.transpose(), 48, axis=1)
-            + 0.125 * np.roll(temperature_profile_res.transpose(), 72, axis=1)
-        )
-        / 1.875
-    ).transpose()
+    temp_profile_geom = pd.DataFrame(
+        geometric_series_mean(temperature_profile_res),
+        index=temperature_profile_res.index,
+        columns=temperature_profile_res.columns,
+    )
 
     h = a / (1 + (b / (temp_profile_geom - 40)) ** c) + d
 
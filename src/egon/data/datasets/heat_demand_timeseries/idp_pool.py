@@ -8,9 +8,9 @@ import numpy as np
 import pandas as pd
 
 from egon.data import db
-
-
-from math import ceil
+from egon.data.datasets.heat_demand_timeseries.daily import (
+    temperature_interval,
+)
 
 import egon
 
@@ -26,72 +26,6 @@ class EgonHeatTimeseries(Base):
     selected_idp_profiles = Column(ARRAY(Integer))
 
 
-def temperature_classes():
-    return {
-        -20: 1,
-        -19: 1,
-        -18: 1,
-        -17: 1,
-        -16: 1,
-        -15: 1,
-        -14: 2,
-        -13: 2,
-        -12: 2,
-        -11: 2,
-        -10: 2,
-        -9: 3,
-        -8: 3,
-        -7: 3,
-        -6: 3,
-        -5: 3,
-        -4: 4,
-        -3: 4,
-        -2: 4,
-        -1: 4,
-        0: 4,
-        1: 5,
-        2: 5,
-        3: 5,
-        4: 5,
-        5: 5,
-        6: 6,
-        7: 6,
-        8: 6,
-        9: 6,
-        10: 6,
-        11: 7,
-        12: 7,
-        13: 7,
-        14: 7,
-        15: 7,
-        16: 8,
-        17: 8,
-        18: 8,
-        19: 8,
-        20: 8,
-        21: 9,
-        22: 9,
-        23: 9,
-        24: 9,
-        25: 9,
-        26: 10,
-        27: 10,
-        28: 10,
-        29: 10,
-        30: 10,
-        31: 10,
-        32: 10,
-        33: 10,
-        34: 10,
-        35: 10,
-        36: 10,
-        37: 10,
-        38: 10,
-        39: 10,
-        40: 10,
-    }
-
-
 def idp_pool_generator():
     """
     Description: Create List of Dataframes for each temperature class for each household stock
@@ -115,71 +49,28 @@ def idp_pool_generator():
     mfh = pd.read_hdf(path, key="MFH")
     temp = pd.read_hdf(path, key="temperature")
 
-    globals()["luebeck_sfh"] = sfh[sfh.filter(like="Luebeck").columns]
-    globals()["luebeck_mfh"] = mfh[mfh.filter(like="Luebeck").columns]
-
-    globals()["kassel_sfh"] = sfh[sfh.filter(like="Kassel").columns]
-    globals()["kassel_mfh"] = mfh[mfh.filter(like="Kassel").columns]
-
-    globals()["wuerzburg_sfh"] = sfh[sfh.filter(like="Wuerzburg").columns]
-    globals()["wuerzburg_mfh"] = mfh[mfh.filter(like="Wuerzburg").columns]
-
-    globals()["chemnitz_sfh"] = sfh[sfh.filter(like="Chemnitz").columns]
-    globals()["chemnitz_mfh"] = mfh[mfh.filter(like="Chemnitz").columns]
-
-    temp_daily = pd.DataFrame()
-    for column in temp.columns:
-        temp_current = (
-            temp[column]
-            .resample("D")
-            .mean()
-            .reindex(temp.index)
-            .fillna(method="ffill")
-            .fillna(method="bfill")
-        )
-        temp_current_geom = temp_current
-        temp_daily = pd.concat([temp_daily, temp_current_geom], axis=1)
-
-    def round_temperature(station):
-        """
-        Description: Create dataframe to assign temperature class to each day of TRY climate zones
-
-        Parameters
-        ----------
-        station : str
-            Name of the location
+    stations = ["Luebeck", "Kassel", "Wuerzburg", "Chemnitz"]
+    profiles = {
+        (station, household_stock): df[df.filter(like=station).columns]
+        for station in stations
+        for household_stock, df in [("SFH", sfh), ("MFH", mfh)]
+    }
 
-        Returns
-        -------
-        temp_class : pandas.DataFrame
-            Each day assignd to their respective temperature class
+    # Daily mean temperature of every hour for all stations at once
+    temp_daily = (
+        temp.resample("D")
+        .mean()
+        .reindex(temp.index)
+        .fillna(method="ffill")
+        .fillna(method="bfill")
+    )
 
-        """
-        intervals = temperature_classes()
-        temperature_rounded = []
-        for i in temp_daily.loc[:, station]:
-            temperature_rounded.append(ceil(i))
-        temperature_interval = []
-        for i in temperature_rounded:
-            temperature_interval.append(intervals[i])
-        temp_class_dic = {f"Class_{station}": temperature_interval}
-        temp_class = pd.DataFrame.from_dict(temp_class_dic)
-        return temp_class
-
-    temp_class_luebeck = round_temperature("Luebeck")
-    temp_class_kassel = round_temperature("Kassel")
-    temp_class_wuerzburg = round_temperature("Wuerzburg")
-    temp_class_chemnitz = round_temperature("Chemnitz")
-    temp_class = pd.concat(
-        [
-            temp_class_luebeck,
-            temp_class_kassel,
-            temp_class_wuerzburg,
-            temp_class_chemnitz,
-        ],
-        axis=1,
+    # Temperature class of each hour of the TRY climate zones
+    temp_class = pd.DataFrame(
+        temperature_interval(temp_daily[stations]),
+        index=index,
+        columns=[f"Class_{station}" for station in stations],
     )
-    temp_class.set_index(index, inplace=True)
 
     def unique_classes(station):
         """
@@ -190,29 +81,20 @@ def idp_pool_generator():
             Collection of temperature classes for each location
 
         """
-        classes = []
-        for x in temp_class[f"Class_{station}"]:
-            if x not in classes:
-                classes.append(x)
-        classes.sort()
-        return classes
-
-    globals()["luebeck_classes"] = unique_classes("Luebeck")
-    globals()["kassel_classes"] = unique_classes("Kassel")
-    globals()["wuerzburg_classes"] = unique_classes("Wuerzburg")
-    globals()["chemnitz_classes"] = unique_classes("Chemnitz")
+        return np.unique(temp_class[f"Class_{station}"].values).tolist()
+
+    station_classes = {
+        station: unique_classes(station) for station in stations
+    }
 
     stock = ["MFH", "SFH"]
     class_list = [2, 3, 4, 5, 6, 7, 8, 9, 10]
-    for s in stock:
-        for m in class_list:
-            globals()[f"idp_collection_class_{m}_{s}"] = pd.DataFrame(
-                index=range(24)
-            )
+    idp_collection = {(m, s): [] for s in stock for m in class_list}
 
     def splitter(station, household_stock):
         """
-
+        Add the daily profiles of a station to the pools of their
+        temperature classes.
 
         Parameters
         ----------
@@ -226,27 +108,18 @@ def idp_pool_generator():
         None.
 
         """
-        this_classes = globals()["{}_classes".format(station.lower())]
-        for classes in this_classes:
-            this_itteration = globals()[
-                "{}_{}".format(station.lower(), household_stock.lower())
-            ].loc[temp_class["Class_{}".format(station)] == classes, :]
-            days = list(range(int(len(this_itteration) / 24)))
-            for day in days:
-                this_day = this_itteration[day * 24 : (day + 1) * 24]
-                this_day = this_day.reset_index(drop=True)
-                globals()[
-                    f"idp_collection_class_{classes}_{household_stock}"
-                ] = pd.concat(
-                    [
-                        globals()[
-                            f"idp_collection_class_{classes}_{household_stock}"
-                        ],
-                        this_day,
-                    ],
-                    axis=1,
-                    ignore_index=True,
-                )
+        # The temperature class is the same for all hours of a day
+        days = (
+            profiles[(station, household_stock)]
+            .values.astype(np.float32)
+            .reshape(-1, 24, len(profiles[(station, household_stock)].columns))
+        )
+        day_classes = temp_class[f"Class_{station}"].values[::24]
+        for classes in station_classes[station]:
+            # One column per day and profile, ordered by day
+            idp_collection[(classes, household_stock)].append(
+                days[day_classes == classes].transpose(1, 0, 2).reshape(24, -1)
+            )
 
     splitter("Luebeck", "SFH")
     splitter("Kassel", "SFH")
@@ -256,56 +129,24 @@ def idp_pool_generator():
     splitter("Kassel", "MFH")
     splitter("Chemnitz", "MFH")
 
-    def pool_normalize(x):
-        """
-
-
-        Parameters
-        ----------
-        x : pandas.Series
-            24-hour profiles of IDP pool
-
-        Returns
-        -------
-        TYPE : pandas.Series
-            Normalized to their daily total
-
-        """
-        if x.sum() != 0:
-            c = x.sum()
-            return x / c
-        else:
-            return x
+    idp_collection = {
+        key: pd.DataFrame(
+            np.concatenate(pools, axis=1)
+            if pools
+            else np.empty((24, 0), dtype=np.float32)
+        )
+        for key, pools in idp_collection.items()
+    }
 
-    stock = ["MFH", "SFH"]
-    class_list = [2, 3, 4, 5, 6, 7, 8, 9, 10]
-    for s in stock:
+    # Normalize each 24-hour profile to its daily total, profiles without
+    # any demand are kept as they are
+    pools = []
+    for s in ["SFH", "MFH"]:
         for m in class_list:
-            df_name = globals()[f"idp_collection_class_{m}_{s}"]
-            globals()[f"idp_collection_class_{m}_{s}_norm"] = df_name.apply(
-                pool_normalize
-            )
+            pool = idp_collection[(m, s)]
+            pools.append(pool / pool.sum().replace(0, 1))
 
-    return [
-        idp_collection_class_2_SFH_norm,
-        idp_collection_class_3_SFH_norm,
-        idp_collection_class_4_SFH_norm,
-        idp_collection_class_5_SFH_norm,
-        idp_collection_class_6_SFH_norm,
-        idp_collection_class_7_SFH_norm,
-        idp_collection_class_8_SFH_norm,
-        idp_collection_class_9_SFH_norm,
-        idp_collection_class_10_SFH_norm,
-        idp_collection_class_2_MFH_norm,
-        idp_collection_class_3_MFH_norm,
-        idp_collection_class_4_MFH_norm,
-        idp_collection_class_5_MFH_norm,
-        idp_collection_class_6_MFH_norm,
-        idp_collection_class_7_MFH_norm,
-        idp_collection_class_8_MFH_norm,
-        idp_collection_class_9_MFH_norm,
-        idp_collection_class_10_MFH_norm,
-    ]
+    return pools
 
 
 def create():
@@ -321,28 +162,24 @@ def create():
     idp_list = idp_pool_generator()
     stock = ["MFH", "SFH"]
     class_list = [2, 3, 4, 5, 6, 7, 8, 9, 10]
-    idp_df = pd.DataFrame(columns=["idp", "house", "temperature_class"])
-    for s in stock:
-        for m in class_list:
-            if s == "SFH":
-                i = class_list.index(m)
-            if s == "MFH":
-                i = class_list.index(m) + 9
-            current_pool = idp_list[i]
-            idp_df = pd.concat(
-                [
-                    idp_df,
-                    pd.DataFrame(
-                        data={
-                            "idp": current_pool.transpose().values.tolist(),
-                            "house": s,
-                            "temperature_class": m,
-                        }
-                    ),
-                ],
-                ignore_index=True,
-            )
-    idp_df = idp_df.reset_index(drop=True)
+    pools = [
+        (s, m, idp_list[class_list.index(m) + (9 if s == "MFH" else 0)])
+        for s in stock
+        for m in class_list
+    ]
+    # One row per 24-hour profile, pools are stored with one profile per
+    # column
+    idp = np.concatenate([pool.values.T for _, _, pool in pools])
+    pool_sizes = [pool.shape[1] for _, _, pool in pools]
+    idp_df = pd.DataFrame(
+        data={
+            "idp": idp.tolist(),
+            "house": np.repeat([s for s, _, _ in pools], pool_sizes),
+            "temperature_class": np.repeat(
+                [m for _, m, _ in pools], pool_sizes
+            ),
+        }
+    )
 
     idp_df.to_sql(
         "egon_heat_idp_pool",
@@ -358,9 +195,7 @@ def create():
         },
     )
 
-    idp_df["idp"] = idp_df.idp.apply(lambda x: np.array(x))
-
-    idp_df.idp = idp_df.idp.apply(lambda x: x.astype(np.float32))
+    idp_df["idp"] = list(idp.astype(np.float32))
 
     return idp_df
 
@@ -389,39 +224,26 @@ def annual_demand_generator(scenario):
         index_col="zensus_population_id",
     )
 
-    house_count_MFH = db.select_dataframe(
+    # Count buildings with one (SFH) and more (MFH) households per cell
+    # in one aggregation
+    house_count = db.select_dataframe(
         """
-        
-        SELECT cell_id as zensus_population_id, COUNT(*) as number FROM 
+        SELECT cell_id as zensus_population_id,
+        COUNT(*) FILTER (WHERE a.count = 1) as "SFH",
+        COUNT(*) FILTER (WHERE a.count > 1) as "MFH"
+        FROM
         (
         SELECT cell_id, COUNT(*), building_id
         FROM demand.egon_household_electricity_profile_of_buildings
         GROUP BY (cell_id, building_id)
         ) a
-        
-        WHERE a.count >1
-        GROUP BY cell_id
-        """,
-        index_col="zensus_population_id",
-    )
-
-    house_count_SFH = db.select_dataframe(
-        """
-        
-        SELECT cell_id as zensus_population_id, COUNT(*) as number FROM 
-        (
-        SELECT cell_id, COUNT(*), building_id
-        FROM demand.egon_household_electricity_profile_of_buildings
-        GROUP BY (cell_id, building_id)
-        ) a 
-        WHERE a.count = 1
         GROUP BY cell_id
         """,
         index_col="zensus_population_id",
     )
 
-    demand_zone["SFH"] = house_count_SFH.number
-    demand_zone["MFH"] = house_count_MFH.number
+    demand_zone["SFH"] = house_count.SFH
+    demand_zone["MFH"] = house_count.MFH
 
     demand_zone["SFH"].fillna(0, inplace=True)
     demand_zone["MFH"].fillna(0, inplace=True)
@@ -479,206 +301,105 @@ def select():
         seed=egon.data.config.settings()["egon-data"]["--random-seed"]
     )
 
-    for station in houses_per_climate_zone.index:
-        result_SFH = pd.DataFrame(columns=range(1, 366))
-        result_MFH = pd.DataFrame(columns=range(1, 366))
-
-        # Randomly select individual daily demand profile for selected climate zone
-        for day in range(1, 366):
-            t_class = temperature_classes.loc[
-                (temperature_classes.climate_zone == station)
-                & (temperature_classes.day_of_year == day),
-                "temperature_class",
-            ].values[0]
-
-            result_SFH[day] = np.random.choice(
-                np.array(
-                    idp_df[
-                        (idp_df.temperature_class == t_class)
-                        & (idp_df.house == "SFH")
-                    ].index.values
-                ),
-                houses_per_climate_zone.loc[station, "SFH"],
-            )
-
-            result_MFH[day] = np.random.choice(
-                np.array(
-                    idp_df[
-                        (idp_df.temperature_class == t_class)
-                        & (idp_df.house == "MFH")
-                    ].index.values
-                ),
-                houses_per_climate_zone.loc[station, "MFH"],
-            )
-
-        result_SFH["zensus_population_id"] = (
-            annual_demand[annual_demand.climate_zone == station]
-            .loc[
-                annual_demand[
-                    annual_demand.climate_zone == station
-                ].index.repeat(
-                    annual_demand[
-                        annual_demand.climate_zone == station
-                    ].SFH.astype(int)
-                )
+    # Indices of the intra-day profiles per household stock and temperature
+    # class, padded to the size of the largest pool
+    class_list = np.sort(idp_df.temperature_class.unique())
+    profile_pools = {}
+    for house in ["SFH", "MFH"]:
+        indices = [
+            idp_df.index.values[
+                (idp_df.temperature_class == t_class) & (idp_df.house == house)
             ]
-            .index.values
+            for t_class in class_list
+        ]
+        sizes = np.array([len(pool) for pool in indices])
+        padded = np.zeros((len(class_list), sizes.max()), dtype=int)
+        for row, pool in enumerate(indices):
+            padded[row, : len(pool)] = pool
+        profile_pools[house] = (padded, sizes)
+
+    def draw_profiles(house, day_classes, number):
+        """Draw one profile per house and day out of its class pool"""
+        padded, sizes = profile_pools[house]
+        choices = np.random.randint(
+            0, sizes[day_classes], size=(number, len(day_classes))
+        )
+        return pd.DataFrame(
+            padded[day_classes, choices], columns=range(1, 366)
         )
 
-        result_SFH["building_id"] = (
-            db.select_dataframe(
-                """
-        
-            SELECT cell_id as zensus_population_id, building_id FROM 
+    # Buildings with one (SFH) or more (MFH) households per census cell,
+    # selected once for all climate zones
+    buildings = {
+        house: db.select_dataframe(
+            f"""
+            SELECT cell_id as zensus_population_id, building_id FROM
             (
             SELECT cell_id, COUNT(*), building_id
             FROM demand.egon_household_electricity_profile_of_buildings
             GROUP BY (cell_id, building_id)
-            ) a 
-            WHERE a.count = 1
+            ) a
+            WHERE a.count {condition}
             """,
-                index_col="zensus_population_id",
-            )
-            .loc[result_SFH["zensus_population_id"].unique(), "building_id"]
-            .values
-        )
-
-        result_MFH["zensus_population_id"] = (
-            annual_demand[annual_demand.climate_zone == station]
-            .loc[
-                annual_demand[
-                    annual_demand.climate_zone == station
-                ].index.repeat(
-                    annual_demand[
-                        annual_demand.climate_zone == station
-                    ].MFH.astype(int)
-                )
-            ]
-            .index.values
+            index_col="zensus_population_id",
         )
+        for house, condition in [("SFH", "= 1"), ("MFH", "> 1")]
+    }
 
-        result_MFH["building_id"] = (
-            db.select_dataframe(
-                """
-        
-            SELECT cell_id as zensus_population_id, building_id FROM 
-            (
-            SELECT cell_id, COUNT(*), building_id
-            FROM demand.egon_household_electricity_profile_of_buildings
-            GROUP BY (cell_id, building_id)
-            ) a 
-            WHERE a.count > 1
-            """,
-                index_col="zensus_population_id",
-            )
-            .loc[result_MFH["zensus_population_id"].unique(), "building_id"]
+    for station in houses_per_climate_zone.index:
+        # Position of each day's temperature class in class_list
+        zone_classes = (
+            temperature_classes[temperature_classes.climate_zone == station]
+            .set_index("day_of_year")
+            .loc[range(1, 366), "temperature_class"]
             .values
         )
+        day_classes = pd.Index(class_list).get_indexer(zone_classes)
+        missing = day_classes == -1
+        if missing.any():
+            raise KeyError(
+                "No intra-day profiles for temperature classes "
+                f"{np.unique(zone_classes[missing])} in climate zone {station}"
+            )
 
-        df_sfh = pd.DataFrame(
-            data={
-                "selected_idp_profiles": result_SFH[
-                    range(1, 366)
-                ].values.tolist(),
-                "zensus_population_id": (
-                    annual_demand[annual_demand.climate_zone == station]
-                    .loc[
-                        annual_demand[
-                            annual_demand.climate_zone == station
-                        ].index.repeat(
-                            annual_demand[
-                                annual_demand.climate_zone == station
-                            ].SFH.astype(int)
-                        )
-                    ]
-                    .index.values
-                ),
-                "building_id": (
-                    db.select_dataframe(
-                        """
-            
-                SELECT cell_id as zensus_population_id, building_id FROM 
-                (
-                SELECT cell_id, COUNT(*), building_id
-                FROM demand.egon_household_electricity_profile_of_buildings
-                GROUP BY (cell_id, building_id)
-                ) a 
-                WHERE a.count = 1
-                """,
-                        index_col="zensus_population_id",
-                    )
-                    .loc[
-                        result_SFH["zensus_population_id"].unique(),
-                        "building_id",
-                    ]
-                    .values
-                ),
-            }
-        )
-        start_sfh = datetime.now()
-        df_sfh.set_index(["zensus_population_id", "building_id"]).to_sql(
-            EgonHeatTimeseries.__table__.name,
-            schema=EgonHeatTimeseries.__table__.schema,
-            con=db.engine(),
-            if_exists="append",
-            chunksize=5000,
-            method="multi",
+        # Randomly select individual daily demand profile for selected climate zone
+        result_SFH = draw_profiles(
+            "SFH", day_classes, houses_per_climate_zone.loc[station, "SFH"]
         )
-        print(f"SFH insertation for zone {station}:")
-        print(datetime.now() - start_sfh)
-
-        df_mfh = pd.DataFrame(
-            data={
-                "selected_idp_profiles": result_MFH[
-                    range(1, 366)
-                ].values.tolist(),
-                "zensus_population_id": (
-                    annual_demand[annual_demand.climate_zone == station]
-                    .loc[
-                        annual_demand[
-                            annual_demand.climate_zone == station
-                        ].index.repeat(
-                            annual_demand[
-                                annual_demand.climate_zone == station
-                            ].MFH.astype(int)
-                        )
-                    ]
-                    .index.values
-                ),
-                "building_id": (
-                    db.select_dataframe(
-                        """
-            
-                SELECT cell_id as zensus_population_id, building_id FROM 
-                (
-                SELECT cell_id, COUNT(*), building_id
-                FROM demand.egon_household_electricity_profile_of_buildings
-                GROUP BY (cell_id, building_id)
-                ) a 
-                WHERE a.count > 1
-                """,
-                        index_col="zensus_population_id",
-                    )
-                    .loc[
-                        result_MFH["zensus_population_id"].unique(),
-                        "building_id",
-                    ]
-                    .values
-                ),
-            }
+        result_MFH = draw_profiles(
+            "MFH", day_classes, houses_per_climate_zone.loc[station, "MFH"]
         )
 
-        start_mfh = datetime.now()
-        df_mfh.set_index(["zensus_population_id", "building_id"]).to_sql(
-            EgonHeatTimeseries.__table__.name,
-            schema=EgonHeatTimeseries.__table__.schema,
-            con=db.engine(),
-            if_exists="append",
-            chunksize=5000,
-            method="multi",
-        )
-        print(f"MFH insertation for zone {station}:")
-        print(datetime.now() - start_mfh)
+        zone_demand = annual_demand[annual_demand.climate_zone == station]
+
+        for house, result in [("SFH", result_SFH), ("MFH", result_MFH)]:
+            zensus_ids = zone_demand.loc[
+                zone_demand.index.repeat(zone_demand[house].astype(int))
+            ].index.values
+
+            df_house = pd.DataFrame(
+                data={
+                    "selected_idp_profiles": result[
+                        range(1, 366)
+                    ].values.tolist(),
+                    "zensus_population_id": zensus_ids,
+                    "building_id": buildings[house]
+                    .loc[pd.unique(zensus_ids), "building_id"]
+                    .values,
+                }
+            )
+
+            start_house = datetime.now()
+            df_house.set_index(["zensus_population_id", "building_id"]).to_sql(
+                EgonHeatTimeseries.__table__.name,
+                schema=EgonHeatTimeseries.__table__.schema,
+                con=db.engine(),
+                if_exists="append",
+                chunksize=5000,
+                method="multi",
+            )
+            print(f"{house} insertation for zone {station}:")
+            print(datetime.now() - start_house)
 
     print("Time for overall profile selection:")
     print(datetime.now() - start_profile_selector)
@@ -127,31 +127,28 @@ def cts_demand_per_aggregation_level(aggregation_level, scenario):
 
         CTS_per_district = CTS_per_district.groupby(lambda x: x, axis=0).sum()
         CTS_per_district = CTS_per_district.transpose()
-        CTS_per_district = CTS_per_district.apply(lambda x: x / x.sum())
+        CTS_per_district = CTS_per_district.div(CTS_per_district.sum())
         CTS_per_district.columns.name = "area_id"
         CTS_per_district.reset_index(drop=True, inplace=True)
 
-        # mv_grid = mv_grid.set_index("zensus_population_id")
-        district_heating = district_heating.set_index("zensus_population_id")
-
+        # Census cells outside of district heating areas
         mv_grid_ind = db.select_dataframe(
             f"""
             SELECT bus_id, a.zensus_population_id
             FROM boundaries.egon_map_zensus_grid_districts a
 
-				JOIN demand.egon_peta_heat c
-				ON a.zensus_population_id = c.zensus_population_id 
+            JOIN demand.egon_peta_heat c
+            ON a.zensus_population_id = c.zensus_population_id
 
-				WHERE c.scenario = '{scenario}'
-				AND c.sector = 'service'
+            WHERE c.scenario = '{scenario}'
+            AND c.sector = 'service'
+            AND a.zensus_population_id NOT IN (
+                SELECT zensus_population_id
+                FROM demand.egon_map_zensus_district_heating_areas
+                WHERE scenario = '{scenario}'
+            )
             """
         )
-
-        mv_grid_ind = mv_grid_ind[
-            ~mv_grid_ind.zensus_population_id.isin(
-                district_heating.index.values
-            )
-        ]
         CTS_per_grid = pd.merge(
             CTS_per_zensus,
             mv_grid_ind,
@@ -163,7 +160,7 @@ def cts_demand_per_aggregation_level(aggregation_level, scenario):
 
         CTS_per_grid = CTS_per_grid.groupby(lambda x: x, axis=0).sum()
         CTS_per_grid = CTS_per_grid.transpose()
-        CTS_per_grid = CTS_per_grid.apply(lambda x: x / x.sum())
+        CTS_per_grid = CTS_per_grid.div(CTS_per_grid.sum())
         CTS_per_grid.columns.name = "bus_id"
         CTS_per_grid.reset_index(drop=True, inplace=True)
 
@@ -176,7 +173,7 @@ def cts_demand_per_aggregation_level(aggregation_level, scenario):
 
         CTS_per_zensus = CTS_per_zensus.groupby(lambda x: x, axis=0).sum()
         CTS_per_zensus = CTS_per_zensus.transpose()
-        CTS_per_zensus = CTS_per_zensus.apply(lambda x: x / x.sum())
+        CTS_per_zensus = CTS_per_zensus.div(CTS_per_zensus.sum())
         CTS_per_zensus.columns.name = "zensus_population_id"
         CTS_per_zensus.reset_index(drop=True, inplace=True)
 
@@ -287,25 +284,25 @@ def CTS_demand_scale(aggregation_level):
             )
             CTS_district = CTS_district.sort_index()
 
+            # Census cells outside of district heating areas
             mv_grid_ind = db.select_dataframe(
                 f"""
                 SELECT bus_id, a.zensus_population_id
                 FROM boundaries.egon_map_zensus_grid_districts a
 
-				JOIN demand.egon_peta_heat c
-				ON a.zensus_population_id = c.zensus_population_id 
+                JOIN demand.egon_peta_heat c
+                ON a.zensus_population_id = c.zensus_population_id
 
-				WHERE c.scenario = '{scenario}'
-				AND c.sector = 'service'
+                WHERE c.scenario = '{scenario}'
+                AND c.sector = 'service'
+                AND a.zensus_population_id NOT IN (
+                    SELECT zensus_population_id
+                    FROM demand.egon_map_zensus_district_heating_areas
+                    WHERE scenario = '{scenario}'
+                )
                 """
             )
 
-            mv_grid_ind = mv_grid_ind[
-                ~mv_grid_ind.zensus_population_id.isin(
-                    district_heating.zensus_population_id.values
-                )
-            ]
-
             CTS_demands_grid = pd.merge(
                 demand,
                 mv_grid_ind[["bus_id", "zensus_population_id"]],
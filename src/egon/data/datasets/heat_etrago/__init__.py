@@ -164,10 +164,7 @@ def insert_store(scenario, carrier):
 
     water_tank_bus = dh_bus.copy()
     water_tank_bus.carrier = carrier + "_store"
-    water_tank_bus.bus_id = range(
-        db.next_etrago_id("bus"),
-        db.next_etrago_id("bus") + len(water_tank_bus),
-    )
+    water_tank_bus.bus_id = db.next_etrago_ids("bus", len(water_tank_bus))
 
     water_tank_bus.to_postgis(
         targets["heat_buses"]["table"],
@@ -177,23 +174,20 @@ def insert_store(scenario, carrier):
         index=False,
     )
 
+    heat_params = get_sector_parameters("heat", scenario)
+
     water_tank_charger = pd.DataFrame(
         data={
             "scn_name": scenario,
             "bus0": dh_bus.bus_id,
             "bus1": water_tank_bus.bus_id,
             "carrier": carrier + "_store_charger",
-            "efficiency": get_sector_parameters("heat", scenario)[
-                "efficiency"
-            ]["water_tank_charger"],
-            "marginal_cost": get_sector_parameters("heat", scenario)[
-                "marginal_cost"
-            ]["water_tank_charger"],
+            "efficiency": heat_params["efficiency"]["water_tank_charger"],
+            "marginal_cost": heat_params["marginal_cost"][
+                "water_tank_charger"
+            ],
             "p_nom_extendable": True,
-            "link_id": range(
-                db.next_etrago_id("link"),
-                db.next_etrago_id("link") + len(water_tank_bus),
-            ),
+            "link_id": db.next_etrago_ids("link", len(water_tank_bus)),
         }
     )
 
@@ -211,17 +205,12 @@ def insert_store(scenario, carrier):
             "bus0": water_tank_bus.bus_id,
             "bus1": dh_bus.bus_id,
             "carrier": carrier + "_store_discharger",
-            "efficiency": get_sector_parameters("heat", scenario)[
-                "efficiency"
-            ]["water_tank_discharger"],
-            "marginal_cost": get_sector_parameters("heat", scenario)[
-                "marginal_cost"
-            ]["water_tank_discharger"],
+            "efficiency": heat_params["efficiency"]["water_tank_discharger"],
+            "marginal_cost": heat_params["marginal_cost"][
+                "water_tank_discharger"
+            ],
             "p_nom_extendable": True,
-            "link_id": range(
-                db.next_etrago_id("link"),
-                db.next_etrago_id("link") + len(water_tank_bus),
-            ),
+            "link_id": db.next_etrago_ids("link", len(water_tank_bus)),
         }
     )
 
@@ -238,17 +227,14 @@ def insert_store(scenario, carrier):
             "scn_name": scenario,
             "bus": water_tank_bus.bus_id,
             "carrier": carrier + "_store",
-            "capital_cost": get_sector_parameters("heat", scenario)[
-                "capital_cost"
-            ][f"{carrier.split('_')[0]}_water_tank"],
-            "lifetime": get_sector_parameters("heat", scenario)["lifetime"][
+            "capital_cost": heat_params["capital_cost"][
+                f"{carrier.split('_')[0]}_water_tank"
+            ],
+            "lifetime": heat_params["lifetime"][
                 f"{carrier.split('_')[0]}_water_tank"
             ],
             "e_nom_extendable": True,
-            "store_id": range(
-                db.next_etrago_id("store"),
-                db.next_etrago_id("store") + len(water_tank_bus),
-            ),
+            "store_id": db.next_etrago_ids("store", len(water_tank_bus)),
         }
     )
 
@@ -460,12 +446,13 @@ def insert_central_gas_boilers(scenario):
     central_boilers = link_geom_from_buses(central_boilers, scenario)
 
     # Add efficiency and marginal costs of gas boilers
-    central_boilers["efficiency"] = get_sector_parameters("heat", scenario)[
-        "efficiency"
-    ]["central_gas_boiler"]
-    central_boilers["marginal_cost"] = get_sector_parameters(
-        "heat", scenario
-    )["marginal_cost"]["central_gas_boiler"]
+    heat_params = get_sector_parameters("heat", scenario)
+    central_boilers["efficiency"] = heat_params["efficiency"][
+        "central_gas_boiler"
+    ]
+    central_boilers["marginal_cost"] = heat_params["marginal_cost"][
+        "central_gas_boiler"
+    ]
 
     # Transform thermal capacity to CH4 installed capacity
     central_boilers["p_nom"] = central_boilers.capacity.div(
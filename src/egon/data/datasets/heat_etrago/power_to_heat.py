@@ -68,9 +68,8 @@ def insert_individual_power_to_heat(scenario):
             {sources['individual_heating_supply']['table']} a
         JOIN {targets['heat_buses']['schema']}.
         {targets['heat_buses']['table']} b
-        ON ST_Intersects(
-            ST_Buffer(ST_Transform(ST_Centroid(a.geometry), 4326), 0.00000001),
-            geom)
+        ON ST_DWithin(
+            ST_Transform(ST_Centroid(a.geometry), 4326), geom, 0.00000001)
         JOIN {sources['weather_cells']['schema']}.
             {sources['weather_cells']['table']} c
         ON ST_Intersects(
@@ -5,9 +5,11 @@
 from geoalchemy2.types import Geometry
 from sqlalchemy import Column, Float, ForeignKey, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
+import geopandas as gpd
+import pandas as pd
 
 from egon.data import config, db
-from egon.data.datasets import Dataset
+from egon.data.datasets import Dataset, wrapped_partial
 from egon.data.datasets.district_heating_areas import EgonDistrictHeatingAreas
 from egon.data.datasets.heat_supply.district_heating import (
     backup_gas_boilers,
@@ -64,8 +66,16 @@ def create_tables():
     EgonIndividualHeatingSupply.__table__.create(bind=engine, checkfirst=True)
 
 
-def district_heating():
-    """Insert supply for district heating areas
+def district_heating(scenario):
+    """Insert supply for district heating areas of one scenario
+
+    The scenarios do not depend on each other, they are run as parallel
+    tasks of the dataset.
+
+    Parameters
+    ----------
+    scenario : str
+        Name of the scenario
 
     Returns
     -------
@@ -79,70 +89,76 @@ def district_heating():
         f"""
         DELETE FROM {targets['district_heating_supply']['schema']}.
         {targets['district_heating_supply']['table']}
+        WHERE scenario = '{scenario}'
         """
     )
 
-    for scenario in config.settings()["egon-data"]["--scenarios"]:
-        supply = cascade_heat_supply(scenario, plotting=False)
+    supply = cascade_heat_supply(scenario, plotting=False)
 
-        supply["scenario"] = scenario
+    supply["scenario"] = scenario
 
-        supply.to_postgis(
-            targets["district_heating_supply"]["table"],
-            schema=targets["district_heating_supply"]["schema"],
-            con=db.engine(),
-            if_exists="append",
-        )
+    supply.to_postgis(
+        targets["district_heating_supply"]["table"],
+        schema=targets["district_heating_supply"]["schema"],
+        con=db.engine(),
+        if_exists="append",
+    )
 
-        # Do not check data for status2019 as is it not listed in the table
-        if scenario != "status2019":
-            # Compare target value with sum of distributed heat supply
-            df_check = db.select_dataframe(
-                f"""
-                SELECT a.carrier,
-                (SUM(a.capacity) - b.capacity) / SUM(a.capacity) as deviation
-                FROM {targets['district_heating_supply']['schema']}.
-                {targets['district_heating_supply']['table']} a,
-                {sources['scenario_capacities']['schema']}.
-                {sources['scenario_capacities']['table']} b
-                WHERE a.scenario = '{scenario}'
-                AND b.scenario_name = '{scenario}'
-                AND b.carrier = CONCAT('urban_central_', a.carrier)
-                GROUP BY (a.carrier,  b.capacity);
-                """
-            )
-            # If the deviation is > 1%, throw an error
-            assert (
-                df_check.deviation.abs().max() < 1
-            ), f"""Unexpected deviation between target value and distributed
-                heat supply: {df_check}
+    # Do not check data for status2019 as is it not listed in the table
+    if scenario != "status2019":
+        # Compare target value with sum of distributed heat supply
+        df_check = db.select_dataframe(
+            f"""
+            SELECT a.carrier,
+            (SUM(a.capacity) - b.capacity) / SUM(a.capacity) as deviation
+            FROM {targets['district_heating_supply']['schema']}.
+            {targets['district_heating_supply']['table']} a,
+            {sources['scenario_capacities']['schema']}.
+            {sources['scenario_capacities']['table']} b
+            WHERE a.scenario = '{scenario}'
+            AND b.scenario_name = '{scenario}'
+            AND b.carrier = CONCAT('urban_central_', a.carrier)
+            GROUP BY (a.carrier,  b.capacity);
             """
+        )
+        # If the deviation is > 1%, throw an error
+        assert (
+            df_check.deviation.abs().max() < 1
+        ), f"""Unexpected deviation between target value and distributed
+            heat supply: {df_check}
+        """
 
-        # Add gas boilers as conventional backup capacities
-        backup = backup_gas_boilers(scenario)
+    # Add gas boilers as conventional backup capacities
+    backup = [backup_gas_boilers(scenario)]
 
-        backup.to_postgis(
-            targets["district_heating_supply"]["table"],
-            schema=targets["district_heating_supply"]["schema"],
-            con=db.engine(),
-            if_exists="append",
-        )
+    # Add resistive heaters which are not available in status2019
+    if scenario != "status2019":
+        backup_rh = backup_resistive_heaters(scenario)
+
+        if not backup_rh.empty:
+            backup.append(backup_rh)
+
+    # Insert all backup capacities at once
+    gpd.GeoDataFrame(
+        pd.concat(backup, ignore_index=True), geometry="geometry"
+    ).to_postgis(
+        targets["district_heating_supply"]["table"],
+        schema=targets["district_heating_supply"]["schema"],
+        con=db.engine(),
+        if_exists="append",
+    )
 
-        # Insert resistive heaters which are not available in status2019
-        if scenario != "status2019":
-            backup_rh = backup_resistive_heaters(scenario)
 
-            if not backup_rh.empty:
-                backup_rh.to_postgis(
-                    targets["district_heating_supply"]["table"],
-                    schema=targets["district_heating_supply"]["schema"],
-                    con=db.engine(),
-                    if_exists="append",
-                )
+def individual_heating(scenario):
+    """Insert supply for individual heating of one scenario
 
+    The scenarios do not depend on each other, they are run as parallel
+    tasks of the dataset.
 
-def individual_heating():
-    """Insert supply for individual heating
+    Parameters
+    ----------
+    scenario : str
+        Name of the scenario
 
     Returns
     -------
@@ -151,44 +167,61 @@ def individual_heating():
     """
     targets = config.datasets()["heat_supply"]["targets"]
 
-    for scenario in config.settings()["egon-data"]["--scenarios"]:
-        db.execute_sql(
-            f"""
-            DELETE FROM {targets['individual_heating_supply']['schema']}.
-            {targets['individual_heating_supply']['table']}
-            WHERE scenario = '{scenario}'
-            """
-        )
-        if scenario == "eGon2035":
-            distribution_level = "federal_states"
-        else:
-            distribution_level = "national"
+    db.execute_sql(
+        f"""
+        DELETE FROM {targets['individual_heating_supply']['schema']}.
+        {targets['individual_heating_supply']['table']}
+        WHERE scenario = '{scenario}'
+        """
+    )
+    if scenario == "eGon2035":
+        distribution_level = "federal_states"
+    else:
+        distribution_level = "national"
 
-        supply = cascade_heat_supply_indiv(
-            scenario, distribution_level=distribution_level, plotting=False
-        )
+    supply = cascade_heat_supply_indiv(
+        scenario, distribution_level=distribution_level, plotting=False
+    )
 
-        supply["scenario"] = scenario
+    supply["scenario"] = scenario
 
-        supply.to_postgis(
-            targets["individual_heating_supply"]["table"],
-            schema=targets["individual_heating_supply"]["schema"],
-            con=db.engine(),
-            if_exists="append",
-        )
+    supply.to_postgis(
+        targets["individual_heating_supply"]["table"],
+        schema=targets["individual_heating_supply"]["schema"],
+        con=db.engine(),
+        if_exists="append",
+    )
 
 
 class HeatSupply(Dataset):
     def __init__(self, dependencies):
         super().__init__(
             name="HeatSupply",
-            version="0.0.10",
+            version="0.0.12",
             dependencies=dependencies,
             tasks=(
                 create_tables,
                 {
-                    district_heating,
-                    individual_heating,
+                    *{
+                        wrapped_partial(
+                            district_heating,
+                            scenario=scenario,
+                            postfix=f"_{scenario}",
+                        )
+                        for scenario in config.settings()["egon-data"][
+                            "--scenarios"
+                        ]
+                    },
+                    *{
+                        wrapped_partial(
+                            individual_heating,
+                            scenario=scenario,
+                            postfix=f"_{scenario}",
+                        )
+                        for scenario in config.settings()["egon-data"][
+                            "--scenarios"
+                        ]
+                    },
                 },
             ),
         )
@@ -2,7 +2,11 @@
 for district heating areas.
 
 """
+import functools
+
+from shapely import STRtree
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from egon.data import config, db
 from egon.data.datasets.heat_supply.geothermal import calc_geothermal_costs
@@ -41,45 +45,38 @@ def capacity_per_district_heating_category(district_heating_areas, scenario):
         index_col="technology",
     )
 
-    capacity_per_category = pd.DataFrame(
-        index=["small", "medium", "large"],
-        columns=[
-            "solar_thermal_collector",
-            "resistive_heater",
-            "heat_pump",
-            "geo_thermal",
-            "demand",
-        ],
-    )
-
-    capacity_per_category.demand = district_heating_areas.groupby(
-        district_heating_areas.category
-    ).demand.sum()
+    categories = np.array(["small", "medium", "large"])
+    small_and_medium = categories != "large"
 
-    capacity_per_category.loc[
-        ["small", "medium"], "solar_thermal_collector"
-    ] = (
-        target_values.capacity["solar_thermal_collector"]
-        * capacity_per_category.demand
-        / capacity_per_category.demand[["small", "medium"]].sum()
+    demand = (
+        district_heating_areas.groupby(district_heating_areas.category)
+        .demand.sum()
+        .reindex(categories)
+        .to_numpy(dtype=float)
     )
+    capacity = target_values.capacity
 
-    capacity_per_category.loc[:, "heat_pump"] = (
-        target_values.capacity["heat_pump"]
-        * capacity_per_category.demand
-        / capacity_per_category.demand.sum()
-    )
-
-    capacity_per_category.loc[:, "resistive_heater"] = (
-        target_values.capacity["resistive_heater"]
-        * capacity_per_category.demand
-        / capacity_per_category.demand.sum()
+    capacity_per_category = pd.DataFrame(
+        {
+            "solar_thermal_collector": np.where(
+                small_and_medium,
+                capacity["solar_thermal_collector"]
+                * demand
+                / np.nansum(demand[small_and_medium]),
+                np.nan,
+            ),
+            "resistive_heater": (
+                capacity["resistive_heater"] * demand / np.nansum(demand)
+            ),
+            "heat_pump": capacity["heat_pump"] * demand / np.nansum(demand),
+            "geo_thermal": np.where(
+                ~small_and_medium, capacity["geo_thermal"], np.nan
+            ),
+            "demand": demand,
+        },
+        index=categories,
     )
 
-    capacity_per_category.loc["large", "geo_thermal"] = target_values.capacity[
-        "geo_thermal"
-    ]
-
     return capacity_per_category
 
 
@@ -141,23 +138,90 @@ def select_district_heating_areas(scenario):
         index_col="district_heating_id",
     )
 
-    district_heating_areas["category"] = "large"
+    district_heating_areas["category"] = np.select(
+        [
+            district_heating_areas.demand < max_demand_small_district_heating,
+            district_heating_areas.demand < max_demand_medium_district_heating,
+        ],
+        ["small", "medium"],
+        default="large",
+    )
 
-    district_heating_areas.loc[
-        district_heating_areas[
-            district_heating_areas.demand < max_demand_medium_district_heating
-        ].index,
-        "category",
-    ] = "medium"
+    return district_heating_areas
 
-    district_heating_areas.loc[
-        district_heating_areas[
-            district_heating_areas.demand < max_demand_small_district_heating
-        ].index,
-        "category",
-    ] = "small"
 
-    return district_heating_areas
+@functools.lru_cache(maxsize=None)
+def select_district_heating_chp(scenario, chp_table, areas_table):
+    """Selects CHP plants supplying district heating areas per scenario
+
+    The plants don't depend on the size-category of the district heating
+    areas, so they are selected only once per scenario and reused.
+
+    Parameters
+    ----------
+    scenario : str
+        Name of the scenario
+    chp_table : str
+        Name of the CHP table including its schema
+    areas_table : str
+        Name of the district heating areas table including its schema
+
+    Returns
+    -------
+    geopandas.geodataframe.GeoDataFrame
+        Thermal capacity and district heating area id per CHP plant
+
+    """
+    return db.select_geodataframe(
+        f"""SELECT a.geom, th_capacity as capacity, c.area_id
+        FROM {chp_table} a,
+        {areas_table} c
+        WHERE a.district_heating = True
+        AND a.district_heating_area_id = c.area_id
+        AND a.scenario = '{scenario}'
+        AND c.scenario = '{scenario}'
+        """
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def geothermal_potentials(max_geothermal_costs):
+    """Returns areas with geothermal potential below the given costs
+
+    See :func:`calc_geothermal_costs`, the result is reused between calls.
+    """
+    return calc_geothermal_costs(max_geothermal_costs)
+
+
+def share_by_remaining_demand(areas, max_geothermal_costs=None):
+    """Distributes capacities linear to the remaining demand of the areas"""
+    return areas["remaining_demand"] / areas["remaining_demand"].sum()
+
+
+def share_by_geothermal_potential(areas, max_geothermal_costs):
+    """Distributes capacities to areas with geothermal potential"""
+    # Select areas with geothermal potential considering costs
+    gdf_geothermal = geothermal_potentials(max_geothermal_costs)
+    # Select areas which intersect with district heating areas
+    # Both layers are in EPSG:3035, no reprojection needed
+    _, area_idx = STRtree(areas.geometry.values).query(
+        gdf_geothermal.geometry.values,
+        predicate="intersects",
+    )
+    join = pd.Series(
+        areas["remaining_demand"].to_numpy()[area_idx],
+        index=areas.index[area_idx],
+    )
+    # Calculate share of installed capacity
+    return join.groupby(level=0).sum() / join.sum()
+
+
+SHARE_PER_AREA = {
+    "resistive_heater": share_by_remaining_demand,
+    "solar_thermal_collector": share_by_remaining_demand,
+    "heat_pump": share_by_remaining_demand,
+    "geo_thermal": share_by_geothermal_potential,
+}
 
 
 def cascade_per_technology(
@@ -167,6 +231,7 @@ def cascade_per_technology(
     capacity_per_category,
     size_dh,
     max_geothermal_costs=2,
+    sources=None,
 ):
     """Add plants of one technology suppliing district heating
 
@@ -182,6 +247,9 @@ def cascade_per_technology(
         Category of the district heating areas
     max_geothermal_costs : float, optional
         Maxiumal costs of MW geothermal in EUR/MW. The default is 2.
+    sources : dict, optional
+        Heat supply sources from the dataset configuration. Read from the
+        configuration if not given.
 
     Returns
     -------
@@ -193,25 +261,20 @@ def cascade_per_technology(
         List of plants per district heating grid for the selected technology
 
     """
-    sources = config.datasets()["heat_supply"]["sources"]
+    if sources is None:
+        sources = config.datasets()["heat_supply"]["sources"]
 
     tech = technologies[technologies.priority == technologies.priority.max()]
+    tech_name = tech.index[0]
 
     # Assign CHP plants inside district heating area
     # TODO: This has to be updaten when all chp plants are available!
-    if tech.index == "CHP":
-        # Select chp plants from database
-        gdf_chp = db.select_geodataframe(
-            f"""SELECT a.geom, th_capacity as capacity, c.area_id
-            FROM {sources['chp']['schema']}.
-            {sources['chp']['table']} a,
-            {sources['district_heating_areas']['schema']}.
-            {sources['district_heating_areas']['table']} c
-            WHERE a.district_heating = True
-            AND a.district_heating_area_id = c.area_id
-            AND a.scenario = '{scenario}'
-            AND c.scenario = '{scenario}'
-            """
+    if tech_name == "CHP":
+        gdf_chp = select_district_heating_chp(
+            scenario,
+            f"{sources['chp']['schema']}.{sources['chp']['table']}",
+            f"{sources['district_heating_areas']['schema']}."
+            f"{sources['district_heating_areas']['table']}",
         )
 
         gdf_chp = gdf_chp[gdf_chp.area_id.isin(areas.index)]
@@ -224,55 +287,39 @@ def cascade_per_technology(
 
     # Distribute solar thermal and heatpumps linear to remaining demand.
     # Geothermal plants are distributed to areas with geothermal potential.
-    if tech.index in [
-        "resistive_heater",
-        "solar_thermal_collector",
-        "heat_pump",
-        "geo_thermal",
-    ]:
-        if tech.index == "geo_thermal":
-            # Select areas with geothermal potential considering costs
-            gdf_geothermal = calc_geothermal_costs(max_geothermal_costs)
-            # Select areas which intersect with district heating areas
-            join = gpd.sjoin(
-                gdf_geothermal.to_crs(4326), areas, rsuffix="area"
-            )
-            # Calculate share of installed capacity
-            share_per_area = (
-                join.groupby("index_area")["remaining_demand"].sum()
-                / join["remaining_demand"].sum().sum()
-            )
-
-        else:
-            share_per_area = (
-                areas["remaining_demand"] / areas["remaining_demand"].sum()
-            )
+    else:
+        share_per_area = SHARE_PER_AREA[tech_name](areas, max_geothermal_costs)
         # Prepare list of heat supply technologies
-        append_df = pd.DataFrame(
-            (share_per_area).mul(
-                capacity_per_category.loc[size_dh, tech.index].values[0]
-            )
-        ).reset_index()
-        # Rename columns
-        append_df.rename(
-            {
-                "index_area": "district_heating_id",
-                "remaining_demand": "capacity",
-            },
-            axis=1,
-            inplace=True,
+        append_df = (
+            share_per_area.mul(capacity_per_category.at[size_dh, tech_name])
+            .rename_axis("district_heating_id")
+            .rename("capacity")
+            .reset_index()
         )
     # Add heat supply to overall list
     if append_df.size > 0:
-        append_df["carrier"] = tech.index[0]
+        append_df["carrier"] = tech_name
         append_df["category"] = size_dh
-        areas.loc[
-            append_df.district_heating_id, "remaining_demand"
-        ] -= append_df.set_index("district_heating_id").capacity.mul(
-            tech.estimated_flh.values[0]
+        remaining_demand = areas["remaining_demand"].to_numpy(copy=True)
+        area_idx = areas.index.get_indexer(append_df.district_heating_id)
+        missing = area_idx == -1
+        if missing.any():
+            raise KeyError(
+                "Unknown district heating areas: "
+                f"{append_df.district_heating_id[missing].unique()}"
+            )
+        np.subtract.at(
+            remaining_demand,
+            area_idx,
+            append_df.capacity.to_numpy(dtype=float)
+            * tech.estimated_flh.values[0],
         )
+        areas["remaining_demand"] = remaining_demand
     # Select district heating areas which need an additional supply technology
-    areas = areas[areas.remaining_demand >= 0]
+    # Only copy the frame if any area is actually dropped
+    active = areas["remaining_demand"].to_numpy() >= 0
+    if not active.all():
+        areas = areas[active]
 
     # Delete inserted technology from list
     technologies = technologies.drop(tech.index)
@@ -340,19 +387,23 @@ def cascade_heat_supply(scenario, plotting=True):
         }
         capacity_per_category = pd.DataFrame()
 
-    # Initalize Dataframe for results
-    resulting_capacities = pd.DataFrame(
-        columns=["district_heating_id", "carrier", "capacity", "category"]
-    )
+    # Initalize list of results, concatenated once after the cascade
+    resulting_capacities = [
+        pd.DataFrame(
+            columns=["district_heating_id", "carrier", "capacity", "category"]
+        )
+    ]
 
     # Set technology data according to Kurzstudie KWK, NEP 2021
     technology_data = set_technology_data()
 
+    sources = config.datasets()["heat_supply"]["sources"]
+
     for size_dh in ["small", "medium", "large"]:
         # Select areas in size-category
         areas = district_heating_areas[
             district_heating_areas.category == size_dh
-        ].to_crs(4326)
+        ].copy()
 
         # Set remaining_demand to demand for first iteration
         areas["remaining_demand"] = areas["demand"]
@@ -364,23 +415,35 @@ def cascade_heat_supply(scenario, plotting=True):
         # as long as the demand is not covered and there are technologies left
         while (len(technologies) > 0) and (len(areas) > 0):
             areas, technologies, append_df = cascade_per_technology(
-                scenario, areas, technologies, capacity_per_category, size_dh
+                scenario,
+                areas,
+                technologies,
+                capacity_per_category,
+                size_dh,
+                sources=sources,
             )
 
-            resulting_capacities = pd.concat(
-                [resulting_capacities, append_df], ignore_index=True
-            )
+            resulting_capacities.append(append_df)
+
+    resulting_capacities = pd.concat(resulting_capacities, ignore_index=True)
 
     # Plot results per district heating area
     if plotting:
-        plot_heat_supply(resulting_capacities)
+        plot_heat_supply(resulting_capacities, district_heating_areas)
 
-    return gpd.GeoDataFrame(
-        resulting_capacities,
-        geometry=district_heating_areas.geom[
-            resulting_capacities.district_heating_id
-        ].centroid.values,
+    # Compute each centroid once and gather them per resulting plant
+    centroids = district_heating_areas.geom.centroid.values
+    area_idx = district_heating_areas.index.get_indexer(
+        resulting_capacities.district_heating_id
     )
+    missing = area_idx == -1
+    if missing.any():
+        raise KeyError(
+            "Unknown district heating areas: "
+            f"{resulting_capacities.district_heating_id[missing].unique()}"
+        )
+
+    return gpd.GeoDataFrame(resulting_capacities, geometry=centroids[area_idx])
 
 
 def backup_gas_boilers(scenario):
@@ -471,10 +534,29 @@ def backup_resistive_heaters(scenario):
     return df
 
 
-def plot_heat_supply(resulting_capacities):
+def plot_heat_supply(resulting_capacities, district_heating_areas=None):
+    """Plots installed capacities per technology and district heating area
+
+    Parameters
+    ----------
+    resulting_capacities : pandas.DataFrame
+        List of plants per district heating grid
+    district_heating_areas : geopandas.geodataframe.GeoDataFrame, optional
+        District heating areas the plants are assigned to. If not given,
+        the areas of scenario eGon2035 are selected from the database.
+
+    Returns
+    -------
+    None.
+
+    """
+    # matplotlib is only needed for plotting, keep it out of module import
     from matplotlib import pyplot as plt
 
-    district_heating_areas = select_district_heating_areas("eGon2035")
+    if district_heating_areas is None:
+        district_heating_areas = select_district_heating_areas("eGon2035")
+    else:
+        district_heating_areas = district_heating_areas.copy()
 
     for c in ["CHP", "solar_thermal_collector", "geo_thermal", "heat_pump"]:
         district_heating_areas[c] = (
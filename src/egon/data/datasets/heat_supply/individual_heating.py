@@ -204,6 +204,8 @@ from egon.data.datasets.electricity_demand_timeseries.mapping import (
     EgonMapZensusMvgdBuildings,
 )
 from egon.data.datasets.electricity_demand_timeseries.tools import (
+    psql_insert_copy,
+    to_pg_array,
     write_table_to_postgres,
 )
 from egon.data.datasets.emobility.motorized_individual_travel.helpers import (
@@ -1720,6 +1722,9 @@ def export_to_db(df_peak_loads_db, df_heat_mvgd_ts_db, drop=False):
         for column in EgonEtragoTimeseriesIndividualHeating.__table__.columns
     }
     df_heat_mvgd_ts_db = df_heat_mvgd_ts_db.loc[:, dtypes.keys()]
+    df_heat_mvgd_ts_db = to_pg_array(
+        df_heat_mvgd_ts_db, ["dist_aggregated_mw"]
+    )
 
     if drop:
         logger.info(
@@ -1739,7 +1744,7 @@ def export_to_db(df_peak_loads_db, df_heat_mvgd_ts_db, drop=False):
             schema=EgonEtragoTimeseriesIndividualHeating.__table__.schema,
             con=session.connection(),
             if_exists="append",
-            method="multi",
+            method=psql_insert_copy,
             index=False,
             dtype=dtypes,
         )
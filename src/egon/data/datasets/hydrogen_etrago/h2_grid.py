@@ -12,8 +12,9 @@ As the CH4 grid, the H2 pipelines are modelled by PyPSA links.
 
 """
 from geoalchemy2.types import Geometry
-from shapely.geometry import MultiLineString
 import geopandas as gpd
+import numpy as np
+import shapely
 
 from egon.data import db
 from egon.data.datasets.etrago_setup import link_geom_from_buses
@@ -108,8 +109,8 @@ def insert_h2_pipelines():
     new_pipelines = link_geom_from_buses(
         new_pipelines[["bus0", "bus1"]], "eGon100RE"
     )
-    new_pipelines["geom"] = new_pipelines.apply(
-        lambda row: MultiLineString([row["topo"]]), axis=1
+    new_pipelines["geom"] = shapely.multilinestrings(
+        new_pipelines["topo"].values, indices=np.arange(len(new_pipelines))
     )
     new_pipelines = new_pipelines.set_geometry("geom", crs=4326)
     new_pipelines["carrier"] = "H2_gridextension"
@@ -14,6 +14,7 @@ These links are modelling:
 """
 
 from geoalchemy2.types import Geometry
+import pandas as pd
 
 from egon.data import db, config
 from egon.data.datasets.etrago_setup import link_geom_from_buses
@@ -97,25 +98,35 @@ def insert_h2_to_ch4_to_h2():
                 """
             )
 
-            feed_in["p_nom"] = 0
             feed_in["p_nom_extendable"] = False
             # calculation of H2 energy share via volumetric share outsourced
             # in a mixture of H2 and CH4 with 15 %vol share
             H2_share = scn_params["H2_feedin_volumetric_fraction"]
             H2_energy_share = H2_CH4_mix_energy_fractions(H2_share)
 
-            for bus in feed_in["bus1"].values:
-                # calculate the total pipeline capacity connected to a specific bus
-                nodal_capacity = pipeline_capacities.loc[
-                    (pipeline_capacities["bus0"] == bus)
-                    | (pipeline_capacities["bus1"] == bus),
-                    "p_nom",
-                ].sum()
-                # multiply total pipeline capacity with H2 energy share corresponding
-                # to volumetric share
-                feed_in.loc[feed_in["bus1"] == bus, "p_nom"] = (
-                    nodal_capacity * H2_energy_share
+            # calculate the total pipeline capacity connected to each bus,
+            # links connecting a bus to itself are only counted once
+            other_end = (
+                pipeline_capacities["bus0"] != pipeline_capacities["bus1"]
+            )
+            nodal_capacity = (
+                pd.concat(
+                    [
+                        pipeline_capacities.set_index("bus0")["p_nom"],
+                        pipeline_capacities[other_end].set_index("bus1")[
+                            "p_nom"
+                        ],
+                    ]
                 )
+                .groupby(level=0)
+                .sum()
+            )
+            # multiply total pipeline capacity with H2 energy share
+            # corresponding to volumetric share
+            feed_in["p_nom"] = (
+                feed_in["bus1"].map(nodal_capacity).fillna(0)
+                * H2_energy_share
+            )
             technology.append(feed_in)
             links_names.append("H2_feedin")
 
@@ -13,10 +13,10 @@ These links are modelling:
 """
 from geoalchemy2.types import Geometry
 from pyproj import Geod
-from scipy.spatial import cKDTree
-from shapely import geometry
+from sqlalchemy import text
 import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import db, config
 from egon.data.datasets.scenario_parameters import get_sector_parameters
@@ -58,37 +58,37 @@ def insert_power_to_h2_to_power():
             ),
         }
 
-        geom = {"PtH2": [], "H2tP": []}
-        topo = {"PtH2": [], "H2tP": []}
-        p_nom_max = {"PtH2": [], "H2tP": []}
-        length = []
+        # Connect AC to gas and gas to AC
+        coords_AC = shapely.get_coordinates(gdf["geom_AC"].values)
+        coords_gas = shapely.get_coordinates(gdf["geom_gas"].values)
+        topo = {
+            "PtH2": shapely.linestrings(
+                np.stack([coords_AC, coords_gas], axis=1)
+            ),
+            "H2tP": shapely.linestrings(
+                np.stack([coords_gas, coords_AC], axis=1)
+            ),
+        }
+        geom = {
+            key: shapely.multilinestrings(lines, indices=np.arange(len(lines)))
+            for key, lines in topo.items()
+        }
 
+        # Calculate the distance between the power and the gas buses
+        # (lenght of the link)
         geod = Geod(ellps="WGS84")
-
-        # Add missing columns
-        for index, row in gdf.iterrows():
-            # Connect AC to gas
-            line = geometry.LineString([row["geom_AC"], row["geom_gas"]])
-            geom["PtH2"].append(geometry.MultiLineString([line]))
-            topo["PtH2"].append(line)
-
-            # Connect gas to AC
-            line = geometry.LineString([row["geom_gas"], row["geom_AC"]])
-            geom["H2tP"].append(geometry.MultiLineString([line]))
-            topo["H2tP"].append(line)
-
-            lenght_km = (
-                geod.geometry_length(line) / 1000
-            )  # Calculate the distance between the power and the gas buses (lenght of the link)
-            length.append(lenght_km)
-            if (
-                lenght_km > 0.5
-            ):  # If the distance is>500m, the max capacity of the power-to-gas installation is limited to 1 MW
-                p_nom_max["PtH2"].append(1)
-                p_nom_max["H2tP"].append(1)
-            else:
-                p_nom_max["PtH2"].append(float("Inf"))
-                p_nom_max["H2tP"].append(float("Inf"))
+        lenght_km = (
+            geod.inv(
+                coords_gas[:, 0],
+                coords_gas[:, 1],
+                coords_AC[:, 0],
+                coords_AC[:, 1],
+            )[2]
+            / 1000
+        )
+        # If the distance is>500m, the max capacity of the power-to-gas
+        # installation is limited to 1 MW
+        p_nom_max = np.where(lenght_km > 0.5, 1, float("Inf"))
 
         # read carrier information from scnario parameter data
         scn_params = get_sector_parameters("gas", scn_name)
@@ -111,7 +111,8 @@ def insert_power_to_h2_to_power():
         # Drop unused columns
         gdf.drop(columns=["geom_gas", "geom_AC", "dist"], inplace=True)
 
-        # Iterate over carriers
+        # Build the links of both carriers and one id range for all of them
+        links = []
         for key in geom:
 
             gdf["geom"] = geom[key]
@@ -123,7 +124,7 @@ def insert_power_to_h2_to_power():
             gdf["bus0"] = bus_ids[key]["bus0"]
             gdf["bus1"] = bus_ids[key]["bus1"]
 
-            gdf["p_nom_max"] = p_nom_max[key]
+            gdf["p_nom_max"] = p_nom_max
             gdf["carrier"] = carrier[key]
             gdf["efficiency"] = efficiency[key]
 
@@ -137,45 +138,65 @@ def insert_power_to_h2_to_power():
 
             print("Minimal length (in km): " + str(gdf["length"].min()))
 
-            # Select next id value
-            new_id = db.next_etrago_id("link")
-            gdf["link_id"] = range(new_id, new_id + len(gdf))
+            links.append(gdf.copy())
+
+        links = pd.concat(links, ignore_index=True)
+
+        # Select next id values
+        links["link_id"] = db.next_etrago_ids("link", len(links))
+
+        # Replace the existing links of both carriers in one transaction
+        with engine.begin() as con:
+            con.execute(
+                text(
+                    """
+                    DELETE FROM grid.egon_etrago_link
+                    WHERE carrier = ANY(:carriers)
+                    AND scn_name = :scn_name
+                    AND bus0 NOT IN (
+                        SELECT bus_id FROM grid.egon_etrago_bus
+                        WHERE scn_name = :scn_name AND country != 'DE'
+                    ) AND bus1 NOT IN (
+                        SELECT bus_id FROM grid.egon_etrago_bus
+                        WHERE scn_name = :scn_name AND country != 'DE'
+                    )
+                    """
+                ),
+                {"carriers": list(carrier.values()), "scn_name": scn_name},
+            )
 
             # Insert data to db
-            gdf.to_postgis(
+            links.to_postgis(
                 "egon_etrago_h2_link",
-                engine,
+                con,
                 schema="grid",
                 index=False,
                 if_exists="replace",
                 dtype={"geom": Geometry(), "topo": Geometry()},
             )
 
-            db.execute_sql(
-                f"""
-            DELETE FROM grid.egon_etrago_link WHERE "carrier" = '{carrier[key]}'
-            AND scn_name = '{scn_name}' AND bus0 NOT IN (
-                SELECT bus_id FROM grid.egon_etrago_bus
-                WHERE scn_name = '{scn_name}' AND country != 'DE'
-            ) AND bus1 NOT IN (
-                SELECT bus_id FROM grid.egon_etrago_bus
-                WHERE scn_name = '{scn_name}' AND country != 'DE'
-            );
-    
-            select UpdateGeometrySRID('grid', 'egon_etrago_h2_link', 'topo', 4326);
-    
-            INSERT INTO grid.egon_etrago_link (
-                scn_name, link_id, bus0,
-                bus1, p_nom, p_nom_extendable, capital_cost, lifetime, length,
-                geom, topo, efficiency, carrier, p_nom_max
-            )
-            SELECT scn_name, link_id, bus0,
-                bus1, p_nom, p_nom_extendable, capital_cost, lifetime, length,
-                geom, topo, efficiency, carrier, p_nom_max
-            FROM grid.egon_etrago_h2_link;
-    
-            DROP TABLE grid.egon_etrago_h2_link;
-                """
+            con.execute(
+                text(
+                    """
+                    SELECT UpdateGeometrySRID(
+                        'grid', 'egon_etrago_h2_link', 'topo', 4326
+                    );
+
+                    INSERT INTO grid.egon_etrago_link (
+                        scn_name, link_id, bus0,
+                        bus1, p_nom, p_nom_extendable, capital_cost,
+                        lifetime, length,
+                        geom, topo, efficiency, carrier, p_nom_max
+                    )
+                    SELECT scn_name, link_id, bus0,
+                        bus1, p_nom, p_nom_extendable, capital_cost,
+                        lifetime, length,
+                        geom, topo, efficiency, carrier, p_nom_max
+                    FROM grid.egon_etrago_h2_link;
+
+                    DROP TABLE grid.egon_etrago_h2_link;
+                    """
+                )
             )
 
 
@@ -194,37 +215,27 @@ def map_buses(scn_name):
         GeoDataFrame with connected buses.
 
     """
-    # Create dataframes containing all gas buses and all the HV power buses
-    sql_AC = f"""SELECT bus_id, geom
-                FROM grid.egon_etrago_bus
-                WHERE carrier = 'AC' AND scn_name = '{scn_name}'
-                AND country = 'DE';
-                """
-    sql_gas = f"""SELECT bus_id, scn_name, geom
-                FROM grid.egon_etrago_bus
-                WHERE carrier LIKE 'H2%%' AND scn_name = '{scn_name}'
-                AND country = 'DE';"""
-
-    gdf_AC = db.select_geodataframe(sql_AC, epsg=4326)
-    gdf_gas = db.select_geodataframe(sql_gas, epsg=4326)
-
-    # Associate each gas bus to its nearest HV power bus
-    n_gas = np.array(list(gdf_gas.geometry.apply(lambda x: (x.x, x.y))))
-    n_AC = np.array(list(gdf_AC.geometry.apply(lambda x: (x.x, x.y))))
-    btree = cKDTree(n_AC)
-    dist, idx = btree.query(n_gas, k=1)
-    gd_AC_nearest = (
-        gdf_AC.iloc[idx]
-        .rename(columns={"bus_id": "bus0", "geom": "geom_AC"})
-        .reset_index(drop=True)
-    )
-    gdf = pd.concat(
-        [
-            gdf_gas.reset_index(drop=True),
-            gd_AC_nearest,
-            pd.Series(dist, name="dist"),
-        ],
-        axis=1,
+    # Associate each H2 bus to its nearest HV power bus with the KNN
+    # operator of PostGIS, which can make use of the spatial index
+    gdf = db.select_geodataframe(
+        f"""
+        SELECT gas.bus_id AS bus1, gas.scn_name, gas.geom AS geom_gas,
+            ac.bus_id AS bus0, ac.geom AS "geom_AC", ac.dist
+        FROM grid.egon_etrago_bus gas
+        CROSS JOIN LATERAL (
+            SELECT bus_id, geom, gas.geom <-> geom AS dist
+            FROM grid.egon_etrago_bus
+            WHERE carrier = 'AC' AND scn_name = '{scn_name}'
+            AND country = 'DE'
+            ORDER BY gas.geom <-> geom
+            LIMIT 1
+        ) ac
+        WHERE gas.carrier LIKE 'H2%%' AND gas.scn_name = '{scn_name}'
+        AND gas.country = 'DE';
+        """,
+        geom_col="geom_gas",
+        epsg=4326,
     )
+    gdf["geom_AC"] = shapely.from_wkb(gdf["geom_AC"].to_numpy())
 
-    return gdf.rename(columns={"bus_id": "bus1", "geom": "geom_gas"})
+    return gdf
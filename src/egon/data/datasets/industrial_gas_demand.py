@@ -9,15 +9,16 @@ the database after modification are to be found.
 """
 
 from pathlib import Path
+import functools
 import logging
 import os
 import shutil
 
 from geoalchemy2.types import Geometry
-from shapely import wkt
 import numpy as np
 import pandas as pd
 import requests
+import shapely
 
 from egon.data import config, db
 from egon.data.config import settings
@@ -125,6 +126,30 @@ class IndustrialGasDemandeGon100RE(Dataset):
         )
 
 
+@functools.lru_cache(maxsize=None)
+def nuts3_centroids():
+    """Select the centroid of each German NUTS3 area
+
+    The NUTS3 areas do not depend on the scenario or the gas carrier, so
+    they are only read once per process. The returned GeoDataFrame is
+    shared between the calls and must not be modified.
+
+    Returns
+    -------
+    gdf_vg250 : geopandas.GeoDataFrame
+        Centroids of the NUTS3 areas indexed by their NUTS3 code
+
+    """
+    sql_vg250 = """SELECT nuts as nuts3, geometry as geom
+                    FROM boundaries.vg250_krs
+                    WHERE gf = 4 ;"""
+    gdf_vg250 = db.select_geodataframe(sql_vg250, epsg=4326)
+
+    gdf_vg250["point"] = shapely.centroid(gdf_vg250.geometry.values)
+    gdf_vg250 = gdf_vg250.set_index("nuts3")
+    return gdf_vg250.drop(columns=["geom"])
+
+
 def read_industrial_demand(scn_name, carrier):
     """Read the industrial gas demand data in Germany
 
@@ -205,17 +230,7 @@ def read_industrial_demand(scn_name, carrier):
     industrial_loads_list = industrial_loads_list.set_index("nuts3")
 
     # Add the centroid point to each NUTS3 area
-    sql_vg250 = """SELECT nuts as nuts3, geometry as geom
-                    FROM boundaries.vg250_krs
-                    WHERE gf = 4 ;"""
-    gdf_vg250 = db.select_geodataframe(sql_vg250, epsg=4326)
-
-    point = []
-    for index, row in gdf_vg250.iterrows():
-        point.append(wkt.loads(str(row["geom"])).centroid)
-    gdf_vg250["point"] = point
-    gdf_vg250 = gdf_vg250.set_index("nuts3")
-    gdf_vg250 = gdf_vg250.drop(columns=["geom"])
+    gdf_vg250 = nuts3_centroids()
 
     # Match the load to the NUTS3 points
     industrial_loads_list = pd.concat(
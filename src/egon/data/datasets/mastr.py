@@ -19,23 +19,107 @@ Todo: Finish docstring
 TBD
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
 from pathlib import Path
-from urllib.request import urlretrieve
+import hashlib
 import os
 
+from requests.adapters import HTTPAdapter
+import requests
+
 from egon.data.datasets import Dataset
 import egon.data.config
 
 WORKING_DIR_MASTR_OLD = Path(".", "bnetza_mastr", "dump_2021-05-03")
 WORKING_DIR_MASTR_NEW = Path(".", "bnetza_mastr", "dump_2022-11-17")
 
+# One connection pool for all downloads, sized for the download threads
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
+def zenodo_checksums(deposit_id):
+    """Get the MD5 checksums of all files of a Zenodo record
+
+    Parameters
+    ----------
+    deposit_id : int
+        Id of the Zenodo record
+
+    Returns
+    -------
+    dict
+        MD5 hex digest per file name
+
+    """
+    r = _SESSION.get(
+        f"https://zenodo.org/api/records/{deposit_id}", timeout=60
+    )
+    r.raise_for_status()
+
+    return {
+        file["key"]: file["checksum"].split(":")[-1]
+        for file in r.json()["files"]
+    }
+
+
+def download_file(url, target, md5=None):
+    """Download a file in chunks, resuming an interrupted download
+
+    The file is written to `target` with the suffix `.part` first and only
+    renamed to `target` once it is complete. If a partial file is left
+    from a previous run, only the missing bytes are requested. If a
+    checksum is given, it is computed while the file is written and
+    compared before the file is renamed.
+
+    Parameters
+    ----------
+    url : str
+        URL of the file
+    target : pathlib.Path
+        Path to save the file to
+    md5 : str, optional
+        Expected MD5 hex digest of the file
+
+    """
+    part = target.with_name(target.name + ".part")
+    offset = part.stat().st_size if part.is_file() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    checksum = hashlib.md5()
+
+    with _SESSION.get(url, headers=headers, stream=True, timeout=60) as r:
+        # Servers which do not support ranges send the whole file again
+        resume = r.status_code in (206, 416)
+        if resume and md5:
+            with open(part, "rb") as fd:
+                for chunk in iter(lambda: fd.read(2**20), b""):
+                    checksum.update(chunk)
+
+        # The partial file is already complete if nothing is left to send
+        if r.status_code != 416:
+            r.raise_for_status()
+            with open(part, "ab" if resume else "wb") as fd:
+                for chunk in r.iter_content(chunk_size=2**20):
+                    fd.write(chunk)
+                    checksum.update(chunk)
+
+    if md5 and checksum.hexdigest() != md5:
+        part.unlink()
+        raise ValueError(f"Checksum of downloaded file {target} is wrong.")
+
+    part.replace(target)
+
 
 def download_mastr_data():
-    """Download MaStR data from Zenodo"""
+    """Download MaStR data from Zenodo
 
-    def download(dataset_name, download_dir):
-        print(f"Downloading dataset {dataset_name} to {download_dir} ...")
+    The files of both dumps are downloaded concurrently, files which
+    already exist in the download directories are skipped. All downloads
+    are verified with the checksums published by Zenodo.
+    """
+
+    def files_to_download(dataset_name, download_dir):
         # Get parameters from config and set download URL
         data_config = egon.data.config.datasets()[dataset_name]
         zenodo_files_url = (
@@ -43,27 +127,51 @@ def download_mastr_data():
             f"{data_config['deposit_id']}/files/"
         )
 
-        files = []
-        for technology in data_config["technologies"]:
-            files.append(
-                f"{data_config['file_basename']}_{technology}_cleaned.csv"
-            )
+        files = [
+            f"{data_config['file_basename']}_{technology}_cleaned.csv"
+            for technology in data_config["technologies"]
+        ]
         files.append("location_elec_generation_raw.csv")
+        files = [
+            filename
+            for filename in files
+            if not (download_dir / filename).is_file()
+        ]
+        if not files:
+            return []
 
-        # Retrieve specified files
-        for filename in files:
-            if not os.path.isfile(filename):
-                urlretrieve(
-                    zenodo_files_url + filename, download_dir / filename
-                )
+        checksums = zenodo_checksums(data_config["deposit_id"])
+
+        return [
+            (
+                zenodo_files_url + filename,
+                download_dir / filename,
+                checksums.get(filename),
+            )
+            for filename in files
+        ]
 
     if not os.path.exists(WORKING_DIR_MASTR_OLD):
         WORKING_DIR_MASTR_OLD.mkdir(exist_ok=True, parents=True)
     if not os.path.exists(WORKING_DIR_MASTR_NEW):
         WORKING_DIR_MASTR_NEW.mkdir(exist_ok=True, parents=True)
 
-    download(dataset_name="mastr", download_dir=WORKING_DIR_MASTR_OLD)
-    download(dataset_name="mastr_new", download_dir=WORKING_DIR_MASTR_NEW)
+    downloads = files_to_download(
+        dataset_name="mastr", download_dir=WORKING_DIR_MASTR_OLD
+    ) + files_to_download(
+        dataset_name="mastr_new", download_dir=WORKING_DIR_MASTR_NEW
+    )
+
+    # Retrieve specified files
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = {
+            executor.submit(download_file, url, target, md5): target
+            for url, target, md5 in downloads
+        }
+        for future in as_completed(futures):
+            # Raise errors of failed downloads
+            future.result()
+            print(f"Downloaded {futures[future]}")
 
 
 mastr_data_setup = partial(
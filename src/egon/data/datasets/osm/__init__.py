@@ -226,7 +226,7 @@ def add_metadata():
             "metaMetadata": meta_metadata(),
         }
 
-        meta_json = "'" + json.dumps(meta) + "'"
+        meta_json = json.dumps(meta)
 
         db.submit_comment(meta_json, "openstreetmap", table)
 
@@ -4,8 +4,8 @@ Module containing the definition of the open cycle gas turbine links
 """
 from geoalchemy2.types import Geometry
 from scipy.spatial import cKDTree
-import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import config, db
 from egon.data.datasets.etrago_setup import link_geom_from_buses
@@ -41,20 +41,18 @@ def insert_open_cycle_gas_turbines_per_scenario(scn_name):
     carrier = "OCGT"
     gdf["carrier"] = carrier
 
-    buses = tuple(
-        db.select_dataframe(
-            f"""SELECT bus_id FROM grid.egon_etrago_bus
-            WHERE scn_name = '{scn_name}' AND country = 'DE';
-        """
-        )["bus_id"]
-    )
-
     # Delete old entries
     db.execute_sql(
         f"""
         DELETE FROM grid.egon_etrago_link WHERE "carrier" = '{carrier}'
         AND scn_name = '{scn_name}'
-        AND bus0 IN {buses} AND bus1 IN {buses};
+        AND bus0 IN (
+            SELECT bus_id FROM grid.egon_etrago_bus
+            WHERE scn_name = '{scn_name}' AND country = 'DE'
+        ) AND bus1 IN (
+            SELECT bus_id FROM grid.egon_etrago_bus
+            WHERE scn_name = '{scn_name}' AND country = 'DE'
+        );
         """
     )
 
@@ -114,8 +112,8 @@ def map_buses(scn_name):
     gdf_gas = db.select_geodataframe(sql_gas, epsg=4326)
 
     # Associate each power plant AC bus to nearest CH4 bus
-    n_gas = np.array(list(gdf_gas.geometry.apply(lambda x: (x.x, x.y))))
-    n_AC = np.array(list(gdf_AC.geometry.apply(lambda x: (x.x, x.y))))
+    n_gas = shapely.get_coordinates(gdf_gas.geometry.values)
+    n_AC = shapely.get_coordinates(gdf_AC.geometry.values)
     btree = cKDTree(n_gas)
     dist, idx = btree.query(n_AC, k=1)
     gd_gas_nearest = (
@@ -1,6 +1,7 @@
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import db
 from egon.data.datasets.mastr import WORKING_DIR_MASTR_NEW
@@ -413,17 +414,18 @@ def insert():
             hv_substations = hvmv_substation[
                 hvmv_substation["voltage"] >= 110000
             ]
-            hv_substations = (
-                hv_substations.unary_union
-            )  # join all the hv_substations
 
             # check distance to HV substations of PVs with too high installed
             # capacity for MV
 
-            # calculate distance to substations
-            pv_pot_mv_to_hv["dist_to_HV"] = (
-                pv_pot_mv_to_hv["geom"].to_crs(3035).distance(hv_substations)
-            )
+            # calculate distance to the closest substation
+            pv_points = pv_pot_mv_to_hv["geom"].to_crs(3035).values
+            (pv_idx, _), dist = shapely.STRtree(
+                hv_substations.geometry.values
+            ).query_nearest(pv_points, return_distance=True, all_matches=False)
+            dist_to_hv = np.full(len(pv_points), np.nan)
+            dist_to_hv[pv_idx] = dist
+            pv_pot_mv_to_hv["dist_to_HV"] = dist_to_hv
 
             # adjust grid level and keep capacity if transmission lines are
             # close
@@ -434,8 +436,7 @@ def insert():
             pv_pot_hv = pd.concat([pv_pot_hv, pv_pot_mv_to_hv])
 
             # delete PVs which are now HV from MV dataframe
-            for index, pot in pv_pot_mv_to_hv.iterrows():
-                pv_pot_mv = pv_pot_mv.drop([index])
+            pv_pot_mv = pv_pot_mv.drop(pv_pot_mv_to_hv.index)
             pv_pot_hv["voltage_level"] = 4
 
             # keep grid level adjust capacity if transmission lines are too
@@ -3,6 +3,7 @@ from shapely.geometry import MultiPoint, Point
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 
 from egon.data import db
 from egon.data.datasets.mastr import WORKING_DIR_MASTR_NEW
@@ -219,8 +220,8 @@ def generate_wind_farms():
         current_wfs.at[conn_point, "voltage"] = wt_location["voltage"].iat[0]
 
     current_wfs["geometry2"] = current_wfs["geometry"].to_crs(3035)
-    current_wfs["area"] = current_wfs["geometry2"].apply(lambda x: x.area)
-    current_wfs["length"] = current_wfs["geometry2"].apply(lambda x: x.length)
+    current_wfs["area"] = shapely.area(current_wfs["geometry2"].values)
+    current_wfs["length"] = shapely.length(current_wfs["geometry2"].values)
     # The 'filter_wts' is used to discard atypical values for the current wind
     # farms
     current_wfs["filter2"] = current_wfs["geometry2"].apply(
@@ -370,10 +371,14 @@ def wind_power_states(
         lambda x: int(x.split(";")[0])
     )
     hv_substations = hvmv_substation[hvmv_substation["voltage"] >= 110000]
-    hv_substations = hv_substations.unary_union  # join all the hv_substations
-    wf_mv["dist_to_HV"] = (
-        state_wf["geom"].to_crs(3035).distance(hv_substations)
-    )
+    # distance of each wind farm to its closest HV substation
+    wf_points = state_wf["geom"].to_crs(3035).values
+    (wf_idx, _), dist = shapely.STRtree(
+        hv_substations.geometry.values
+    ).query_nearest(wf_points, return_distance=True, all_matches=False)
+    dist_to_hv = np.full(len(wf_points), np.nan)
+    dist_to_hv[wf_idx] = dist
+    wf_mv["dist_to_HV"] = pd.Series(dist_to_hv, index=state_wf.index)
     wf_mv_to_hv = wf_mv[
         (wf_mv["dist_to_HV"] <= max_dist_hv)
         & (wf_mv["inst capacity [MW]"] >= max_power_mv)
@@ -144,16 +144,21 @@ def household_prognosis_per_year(prognosis_nuts3, zensus, year):
     )
 
     # Rounding process to meet exact values from demandregio on nuts3-level
+    rounded = prognosis["rounded"].copy()
     for name, group in prognosis.groupby(prognosis.nuts3):
         print(f"start progosis nuts3 {name}")
-        while prognosis_total[name] > group["rounded"].sum():
-            index = np.random.choice(
-                group["rest"].index.values[group["rest"] == max(group["rest"])]
-            )
-            group.at[index, "rounded"] += 1
-            group.at[index, "rest"] = 0
+        group_rounded = group["rounded"].to_numpy().copy()
+        rest = group["rest"].to_numpy().copy()
+        # keep track of the rounded sum instead of summing up every step
+        rounded_sum = group_rounded.sum()
+        while prognosis_total[name] > rounded_sum:
+            index = np.random.choice(np.flatnonzero(rest == rest.max()))
+            group_rounded[index] += 1
+            rest[index] = 0
+            rounded_sum += 1
         print(f"finished progosis nuts3 {name}")
-        prognosis[prognosis.index.isin(group.index)] = group
+        rounded.loc[group.index] = group_rounded
+    prognosis["rounded"] = rounded
 
     prognosis = prognosis.drop(["nuts3", "quantity", "rest"], axis=1).rename(
         {"rounded": "households"}, axis=1
@@ -216,9 +216,9 @@ def match_storage_units(
         (nep["carrier"] == carrier) & (nep["postcode"] != "None")
     ].iterrows():
         # Select plants from MaStR that match carrier, PLZ
-        # and have a similar capacity
-        # Create a copy of all power plants from MaStR
-        selected = mastr.copy()
+        # and have a similar capacity. The filters below return new
+        # frames, so mastr itself is never changed.
+        selected = mastr
 
         # Set capacity constraint using buffer
         if consider_capacity:
@@ -242,10 +242,10 @@ def match_storage_units(
         elif consider_location == "city":
             selected = selected[selected.city == row.city.replace("\n", " ")]
         elif consider_location == "federal_state":
-            selected.loc[:, "federal_state"] = list_federal_states[
-                selected.federal_state
-            ].values
-            selected = selected[selected.federal_state == row.federal_state]
+            selected = selected[
+                list_federal_states[selected.federal_state].values
+                == row.federal_state
+            ]
 
         # Set capacity constraint if selected
         if consider_carrier:
@@ -3,6 +3,7 @@ The central module containing all code dealing with existing storage units for
 eTraGo.
 """
 
+from sqlalchemy import text
 import geopandas as gpd
 import pandas as pd
 from egon.data import db, config
@@ -45,37 +46,44 @@ def insert_PHES():
             """
         )
 
-        # Select data on PSH units from database
-        phes = db.select_dataframe(
-            f"""SELECT scenario as scn_name, bus_id as bus, carrier, el_capacity as p_nom
-            FROM {sources['storage']['schema']}.{sources['storage']['table']}
-            WHERE carrier = 'pumped_hydro'
-            AND scenario= '{scn}'
-            """
-        )
-
-        # Select unused index of buses
-        next_bus_id = db.next_etrago_id("storage")
-
         # Add missing PHES specific information suitable for eTraGo selected from scenario_parameter table
         parameters = scenario_parameters.electricity(scn)["efficiency"][
             "pumped_hydro"
         ]
-        phes["storage_id"] = range(next_bus_id, next_bus_id + len(phes))
-        phes["max_hours"] = parameters["max_hours"]
-        phes["efficiency_store"] = parameters["store"]
-        phes["efficiency_dispatch"] = parameters["dispatch"]
-        phes["standing_loss"] = parameters["standing_loss"]
-        phes["cyclic_state_of_charge"] = parameters["cyclic_state_of_charge"]
-
-        # Write data to db
-        phes.to_sql(
-            targets["storage"]["table"],
-            engine,
-            schema=targets["storage"]["schema"],
-            if_exists="append",
-            index=phes.index,
-        )
+
+        # Copy the PSH units with new storage ids directly in the database
+        with engine.begin() as con:
+            con.execute(
+                text(
+                    f"""
+                    INSERT INTO {targets['storage']['schema']}.
+                    {targets['storage']['table']} (
+                        scn_name, bus, carrier, p_nom, storage_id,
+                        max_hours, efficiency_store, efficiency_dispatch,
+                        standing_loss, cyclic_state_of_charge
+                    )
+                    SELECT scenario, bus_id, carrier, el_capacity,
+                        ROW_NUMBER() OVER (ORDER BY id) + :next_id - 1,
+                        :max_hours, :efficiency_store, :efficiency_dispatch,
+                        :standing_loss, :cyclic_state_of_charge
+                    FROM {sources['storage']['schema']}.
+                    {sources['storage']['table']}
+                    WHERE carrier = 'pumped_hydro'
+                    AND scenario = :scenario
+                    """
+                ),
+                {
+                    "scenario": scn,
+                    "next_id": db.next_etrago_id("storage"),
+                    "max_hours": parameters["max_hours"],
+                    "efficiency_store": parameters["store"],
+                    "efficiency_dispatch": parameters["dispatch"],
+                    "standing_loss": parameters["standing_loss"],
+                    "cyclic_state_of_charge": parameters[
+                        "cyclic_state_of_charge"
+                    ],
+                },
+            )
 
 
 def extendable_batteries_per_scenario(scenario):
@@ -97,86 +105,58 @@ def extendable_batteries_per_scenario(scenario):
         """
     )
 
-    extendable_batteries = db.select_dataframe(
-        f"""
-        SELECT bus_id as bus, scn_name FROM
-        {sources['bus']['schema']}.
-        {sources['bus']['table']}
-        WHERE carrier = 'AC'
-        AND scn_name = '{scenario}'
-        AND (bus_id IN (SELECT bus_id
-                       FROM {sources['ehv-substation']['schema']}.{sources['ehv-substation']['table']})
-        OR bus_id IN (SELECT bus_id
-                       FROM {sources['hv-substation']['schema']}.{sources['hv-substation']['table']}
-        ))
-        """
-    )
-
-    # Select information on allocated capacities for home batteries from database
-    home_batteries = db.select_dataframe(
-        f"""
-        SELECT el_capacity as p_nom_min, bus_id as bus FROM
-        {sources['storage']['schema']}.
-        {sources['storage']['table']}
-        WHERE carrier = 'home_battery'
-        AND scenario = '{scenario}';
-        """
-    )
-
-    # Update index
-    extendable_batteries[
-        "storage_id"
-    ] = extendable_batteries.index + db.next_etrago_id("storage")
-
-    # Set parameters
-    extendable_batteries["p_nom_extendable"] = True
-
-    extendable_batteries["capital_cost"] = get_sector_parameters(
-        "electricity", scenario
-    )["capital_cost"]["battery"]
-
-    extendable_batteries["lifetime"] = get_sector_parameters(
-        "electricity", scenario
-    )["lifetime"]["battery storage"]
-
-    extendable_batteries["max_hours"] = get_sector_parameters(
-        "electricity", scenario
-    )["efficiency"]["battery"]["max_hours"]
-
-    extendable_batteries["efficiency_store"] = get_sector_parameters(
-        "electricity", scenario
-    )["efficiency"]["battery"]["store"]
-
-    extendable_batteries["efficiency_dispatch"] = get_sector_parameters(
-        "electricity", scenario
-    )["efficiency"]["battery"]["dispatch"]
-
-    extendable_batteries["standing_loss"] = get_sector_parameters(
-        "electricity", scenario
-    )["efficiency"]["battery"]["standing_loss"]
-
-    extendable_batteries["cyclic_state_of_charge"] = get_sector_parameters(
-        "electricity", scenario
-    )["efficiency"]["battery"]["cyclic_state_of_charge"]
-
-    extendable_batteries["carrier"] = "battery"
-
-    # Merge dataframes to fill p_nom_min column
-    extendable_batteries = extendable_batteries.merge(
-        right=home_batteries, left_on="bus", right_on="bus", how="outer"
-    )
-    extendable_batteries["p_nom_min"] = extendable_batteries[
-        "p_nom_min"
-    ].fillna(0)
-
-    # Write data to db
-    extendable_batteries.to_sql(
-        targets["storage"]["table"],
-        engine,
-        schema=targets["storage"]["schema"],
-        if_exists="append",
-        index=False,
-    )
+    parameters = get_sector_parameters("electricity", scenario)
+    battery = parameters["efficiency"]["battery"]
+
+    # Insert one extendable battery per (e)hv substation bus, where the
+    # allocated capacity of home batteries sets the minimal capacity
+    with engine.begin() as con:
+        con.execute(
+            text(
+                f"""
+                INSERT INTO {targets['storage']['schema']}.
+                {targets['storage']['table']} (
+                    bus, scn_name, storage_id, p_nom_extendable,
+                    capital_cost, lifetime, max_hours, efficiency_store,
+                    efficiency_dispatch, standing_loss,
+                    cyclic_state_of_charge, carrier, p_nom_min
+                )
+                SELECT b.bus_id, b.scn_name,
+                    ROW_NUMBER() OVER (ORDER BY b.bus_id) + :next_id - 1,
+                    TRUE, :capital_cost, :lifetime, :max_hours,
+                    :efficiency_store, :efficiency_dispatch,
+                    :standing_loss, :cyclic_state_of_charge, 'battery',
+                    COALESCE(h.el_capacity, 0)
+                FROM {sources['bus']['schema']}.{sources['bus']['table']} b
+                LEFT JOIN {sources['storage']['schema']}.
+                {sources['storage']['table']} h
+                ON h.bus_id = b.bus_id
+                AND h.carrier = 'home_battery'
+                AND h.scenario = :scenario
+                WHERE b.carrier = 'AC'
+                AND b.scn_name = :scenario
+                AND (b.bus_id IN (
+                    SELECT bus_id
+                    FROM {sources['ehv-substation']['schema']}.
+                    {sources['ehv-substation']['table']})
+                OR b.bus_id IN (
+                    SELECT bus_id
+                    FROM {sources['hv-substation']['schema']}.
+                    {sources['hv-substation']['table']}))
+                """
+            ),
+            {
+                "scenario": scenario,
+                "next_id": db.next_etrago_id("storage"),
+                "capital_cost": parameters["capital_cost"]["battery"],
+                "lifetime": parameters["lifetime"]["battery storage"],
+                "max_hours": battery["max_hours"],
+                "efficiency_store": battery["store"],
+                "efficiency_dispatch": battery["dispatch"],
+                "standing_loss": battery["standing_loss"],
+                "cyclic_state_of_charge": battery["cyclic_state_of_charge"],
+            },
+        )
 
 
 def extendable_batteries():
@@ -236,7 +236,7 @@ def add_metadata():
             "metaMetadata": meta_metadata(),
         }
 
-        meta_json = "'" + json.dumps(meta) + "'"
+        meta_json = json.dumps(meta)
 
         db.submit_comment(
             meta_json, vg250_config["processed"]["schema"], table
@@ -508,7 +508,7 @@ def add_metadata_zensus_inside_ger():
         "metaMetadata": meta_metadata(),
     }
 
-    meta_json = "'" + json.dumps(metadata) + "'"
+    meta_json = json.dumps(metadata)
 
     db.submit_comment(
         meta_json,
@@ -647,7 +647,7 @@ def add_metadata_vg250_gem_pop():
         "metaMetadata": meta_metadata(),
     }
 
-    meta_json = "'" + json.dumps(metadata) + "'"
+    meta_json = json.dumps(metadata)
 
     db.submit_comment(
         meta_json,
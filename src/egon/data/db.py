@@ -10,6 +10,7 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import sessionmaker
 import geopandas as gpd
 import pandas as pd
+import shapely
 
 from egon.data import config
 
@@ -81,6 +82,9 @@ def submit_comment(json, schema, table):
     standard for describing our data. Metadata is stored as JSON in the table
     comment.
 
+    The JSON string is passed as bound parameter, so it must not be quoted
+    and may contain any character, including single quotes.
+
     Parameters
     ----------
     json : str
@@ -90,19 +94,17 @@ def submit_comment(json, schema, table):
     table : str
         Database table on which to put the given comment
     """
-    prefix_str = "COMMENT ON TABLE {0}.{1} IS ".format(schema, table)
-
-    check_json_str = (
-        "SELECT obj_description('{0}.{1}'::regclass)::json".format(
-            schema, table
+    with engine().begin() as con:
+        con.execute(
+            text(f'COMMENT ON TABLE "{schema}"."{table}" IS :comment'),
+            {"comment": json},
+        )
+        # Query table comment and cast it into JSON
+        # The query throws an error if JSON is invalid
+        con.execute(
+            text("SELECT obj_description(CAST(:table AS regclass))::json"),
+            {"table": f'"{schema}"."{table}"'},
         )
-    )
-
-    execute_sql(prefix_str + json + ";")
-
-    # Query table comment and cast it into JSON
-    # The query throws an error if JSON is invalid
-    execute_sql(check_json_str)
 
 
 def execute_sql_script(script, encoding="utf-8-sig"):
@@ -214,9 +216,17 @@ def select_geodataframe(sql, index_col=None, geom_col="geom", epsg=3035):
 
     """
 
-    gdf = gpd.read_postgis(
-        sql, engine(), index_col=index_col, geom_col=geom_col
+    df = pd.read_sql(sql, engine(), index_col=index_col)
+
+    # Decode the (E)WKB of all rows in one vectorized call instead of
+    # parsing every geometry on its own
+    geometries = shapely.from_wkb(
+        df[geom_col].to_numpy(dtype=object, na_value=None)
     )
+    srids = shapely.get_srid(geometries[~shapely.is_missing(geometries)])
+    crs = f"EPSG:{srids[0]}" if len(srids) and srids[0] > 0 else None
+    df[geom_col] = gpd.GeoSeries(geometries, index=df.index, crs=crs)
+    gdf = gpd.GeoDataFrame(df, geometry=geom_col)
 
     if gdf.size == 0:
         print(f"WARNING: No data returned by statement: \n {sql}")
@@ -265,6 +275,30 @@ def next_etrago_id(component):
     return next_id
 
 
+def next_etrago_ids(component, number):
+    """Select a range of next id values for components in etrago tables
+
+    Same as :func:`next_etrago_id`, but for several new components at once,
+    which only needs one query.
+
+    Parameters
+    ----------
+    component : str
+        Name of component
+    number : int
+        Number of new components
+
+    Returns
+    -------
+    range
+        Consecutive id values starting at the next index value
+
+    """
+    next_id = next_etrago_id(component)
+
+    return range(next_id, next_id + number)
+
+
 def check_db_unique_violation(func):
     """Wrapper to catch psycopg's UniqueViolation errors during concurrent DB
     commits.
@@ -1,9 +1,12 @@
+import functools
+
 from egon.data.db import engine
 from geoalchemy2 import Geometry
 from sqlalchemy import MetaData, Table
 from sqlalchemy.dialects.postgresql.base import ischema_names
 
 
+@functools.lru_cache(maxsize=None)
 def context():
     """
     Project context information for metadata
@@ -11,7 +14,8 @@ def context():
     Returns
     -------
     dict
-        OEP metadata conform data license information
+        OEP metadata conform data license information. The dict is cached
+        and shared between all callers, do not modify it.
     """
 
     return {
@@ -30,6 +34,7 @@ def context():
     }
 
 
+@functools.lru_cache(maxsize=None)
 def meta_metadata():
     """
     Meta data on metadata
@@ -37,7 +42,8 @@ def meta_metadata():
     Returns
     -------
     dict
-        OEP metadata conform metadata on metadata
+        OEP metadata conform metadata on metadata. The dict is cached and
+        shared between all callers, do not modify it.
     """
 
     return {
@@ -50,6 +56,7 @@ def meta_metadata():
     }
 
 
+@functools.lru_cache(maxsize=None)
 def licenses_datenlizenz_deutschland(attribution):
     """
     License information for Datenlizenz Deutschland
@@ -62,7 +69,8 @@ def licenses_datenlizenz_deutschland(attribution):
     Returns
     -------
     dict
-        OEP metadata conform data license information
+        OEP metadata conform data license information. The dict is cached
+        and shared between all callers, do not modify it.
     """
 
     return {
@@ -98,6 +106,7 @@ def licenses_datenlizenz_deutschland(attribution):
     }
 
 
+@functools.lru_cache(maxsize=None)
 def license_odbl(attribution):
     """
     License information for Open Data Commons Open Database License (ODbL-1.0)
@@ -111,7 +120,8 @@ def license_odbl(attribution):
     Returns
     -------
     dict
-        OEP metadata conform data license information
+        OEP metadata conform data license information. The dict is cached
+        and shared between all callers, do not modify it.
     """
     return {
         "name": "ODbL-1.0",
@@ -123,6 +133,7 @@ def license_odbl(attribution):
     }
 
 
+@functools.lru_cache(maxsize=None)
 def license_ccby(attribution):
     """
     License information for Creative Commons Attribution 4.0 International
@@ -136,7 +147,8 @@ def license_ccby(attribution):
     Returns
     -------
     dict
-        OEP metadata conform data license information
+        OEP metadata conform data license information. The dict is cached
+        and shared between all callers, do not modify it.
     """
     return {
         "name": "CC-BY-4.0",
@@ -148,6 +160,7 @@ def license_ccby(attribution):
     }
 
 
+@functools.lru_cache(maxsize=None)
 def license_geonutzv(attribution):
     """
     License information for GeoNutzV
@@ -160,7 +173,8 @@ def license_geonutzv(attribution):
     Returns
     -------
     dict
-        OEP metadata conform data license information
+        OEP metadata conform data license information. The dict is cached
+        and shared between all callers, do not modify it.
     """
     return {
         "name": "geonutzv-de-2013-03-19",
@@ -179,6 +193,12 @@ def license_geonutzv(attribution):
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _column_types(table):
+    """Names and lower case type names of the columns of a table."""
+    return tuple((col.name, str(col.type).lower()) for col in table.columns)
+
+
 def generate_resource_fields_from_sqla_model(model):
     """ Generate a template for the resource fields for metadata from a SQL
     Alchemy model.
@@ -207,16 +227,24 @@ def generate_resource_fields_from_sqla_model(model):
     """
 
     return [
-        {
-            "name": col.name,
-            "description": "",
-            "type": str(col.type).lower(),
-            "unit": "none",
-        }
-        for col in model.__table__.columns
+        {"name": name, "description": "", "type": col_type, "unit": "none"}
+        for name, col_type in _column_types(model.__table__)
     ]
 
 
+@functools.lru_cache(maxsize=None)
+def _reflect_table(schema, table, geom_columns):
+    """Reflect a database table once per process and set of geometry
+    columns, so repeated metadata generation does not query the database
+    catalog again."""
+    for col in geom_columns:
+        ischema_names[col] = Geometry
+
+    return Table(
+        table, MetaData(), schema=schema, autoload=True, autoload_with=engine()
+    )
+
+
 def generate_resource_fields_from_db_table(schema, table, geom_columns=None):
     """ Generate a template for the resource fields for metadata from a
     database table.
@@ -254,19 +282,10 @@ def generate_resource_fields_from_db_table(schema, table, geom_columns=None):
     # handle geometry columns
     if geom_columns is None:
         geom_columns = ["geom"]
-    for col in geom_columns:
-        ischema_names[col] = Geometry
 
-    table = Table(
-        table, MetaData(), schema=schema, autoload=True, autoload_with=engine()
-    )
+    table = _reflect_table(schema, table, tuple(geom_columns))
 
     return [
-        {
-            "name": col.name,
-            "description": "",
-            "type": str(col.type).lower(),
-            "unit": "none",
-        }
-        for col in table.c
+        {"name": name, "description": "", "type": col_type, "unit": "none"}
+        for name, col_type in _column_types(table)
     ]